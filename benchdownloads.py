@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+
+# Benchmark urldownloader.py's UrlDownloadQueue against a local
+# speedtestserver (and optionally a delaytest.cgi on a web server),
+# over mixes of fast, slow, large and failing URLs at several
+# concurrency levels.
+# Reports requests/sec, MB/s, p50/p99 latency and peak RSS for each run,
+# and writes them all to a JSON file so runs can be compared.
+#
+# Usage: benchdownloads.py [-c 1,4,16] [-o outfile.json]
+#                          [-d http://localhost/delaytest.cgi]
+
+import sys
+import os
+import time
+import json
+import shutil
+import socket
+import tempfile
+import resource
+import subprocess
+
+import urldownloader
+from urldownloader import UrlDownloadQueue
+
+SPEEDTESTSERVER = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                               "speedtestserver")
+
+# Each mix is a list of (count, query) to append to the server's base URL.
+# A query of None means a URL that will fail: nothing listens there.
+MIXES = {
+    "fast":    [ (200, "?bytes=10000") ],
+    "large":   [ (10, "?bytes=20000000") ],
+    "slow":    [ (20, "?bytes=10000&timeout=1") ],
+    "failing": [ (20, None) ],
+    "mixed":   [ (100, "?bytes=10000"), (4, "?bytes=20000000"),
+                 (10, "?bytes=10000&timeout=1"), (10, None) ],
+}
+
+def free_port():
+    s = socket.socket()
+    s.bind(('127.0.0.1', 0))
+    port = s.getsockname()[1]
+    s.close()
+    return port
+
+def start_server(port):
+    '''Start speedtestserver on localhost, and wait until it answers.
+    '''
+    proc = subprocess.Popen(["python3", SPEEDTESTSERVER,
+                             str(port), "127.0.0.1"],
+                            stdout=open(os.devnull, 'w'),
+                            stderr=subprocess.STDOUT)
+    for i in range(50):
+        try:
+            socket.create_connection(('127.0.0.1', port), 1).close()
+            return proc
+        except socket.error:
+            time.sleep(.1)
+    proc.kill()
+    raise RuntimeError("speedtestserver didn't start")
+
+def percentile(values, pct):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100.))]
+
+def run_mix(mix, concurrency, baseurl, failurl, delayurl=None):
+    '''Download one mix of URLs at one concurrency level.
+       Return a dict of results.
+    '''
+    tmpdir = tempfile.mkdtemp(prefix="benchdl-")
+    dlqueue = UrlDownloadQueue(maxthreads=concurrency,
+                               maxperhost=concurrency,
+                               maxretries=1, backoff=.05)
+    n = 0
+    for count, query in MIXES[mix]:
+        for i in range(count):
+            if query is None:
+                url = failurl
+            else:
+                # Vary the path, so nothing can be served from a cache.
+                url = "%s/%d%s" % (baseurl, n, query)
+            dlqueue.add(url, localpath=os.path.join(tmpdir, str(n)),
+                        timeout=30, conditional=False)
+            n += 1
+    # delaytest.cgi trickles out lines slowly, so it counts as slow too.
+    if mix == "slow" and delayurl:
+        for i in range(10):
+            dlqueue.add(delayurl + "?delay=.1&count=10",
+                        localpath=os.path.join(tmpdir, "d%d" % i),
+                        timeout=30, conditional=False)
+            n += 1
+
+    start = time.time()
+    dlqueue.download()
+    dlqueue.wait()
+    elapsed = time.time() - start
+
+    latencies = [ u.elapsed for u in dlqueue.succeeded ]
+    nbytes = sum(u.bytes_downloaded for u in dlqueue.succeeded)
+    shutil.rmtree(tmpdir)
+
+    return {
+        "mix": mix,
+        "concurrency": concurrency,
+        "requests": n,
+        "succeeded": len(dlqueue.succeeded),
+        "failed": len(dlqueue.failed),
+        "seconds": elapsed,
+        "requests_per_sec": n / elapsed,
+        "mb_per_sec": nbytes / elapsed / 1e6,
+        "p50_latency": percentile(latencies, 50),
+        "p99_latency": percentile(latencies, 99),
+        # ru_maxrss is in kilobytes on Linux.
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+def Usage():
+    print "Usage: %s [-c 1,4,16] [-o outfile.json] [-d delaytest-url]" \
+        % os.path.basename(sys.argv[0])
+    sys.exit(1)
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+
+    # benchdownloads.py --run mix concurrency baseurl failurl [delayurl]
+    # runs a single benchmark and prints its results as JSON.
+    # Each run gets its own process so peak RSS means something.
+    if args and args[0] == "--run":
+        urldownloader.DEBUG = None
+        print json.dumps(run_mix(args[1], int(args[2]), *args[3:]))
+        sys.exit(0)
+
+    concurrencies = [ 1, 4, 16 ]
+    outfile = "benchdownloads.json"
+    delayurl = None
+    while args:
+        if args[0] == '-c' and len(args) > 1:
+            concurrencies = [ int(c) for c in args[1].split(',') ]
+        elif args[0] == '-o' and len(args) > 1:
+            outfile = args[1]
+        elif args[0] == '-d' and len(args) > 1:
+            delayurl = args[1]
+        else:
+            Usage()
+        args = args[2:]
+
+    port = free_port()
+    server = start_server(port)
+    baseurl = "http://127.0.0.1:%d" % port
+    failurl = "http://127.0.0.1:%d/nothing" % free_port()
+
+    results = []
+    fmt = "%-8s %4s %8s %9s %8s %8s %8s %9s"
+    print fmt % ("mix", "conc", "ok/all", "req/s", "MB/s",
+                 "p50", "p99", "RSS(KB)")
+    try:
+        for mix in sorted(MIXES):
+            for concurrency in concurrencies:
+                cmd = [ sys.executable, os.path.abspath(__file__), "--run",
+                        mix, str(concurrency), baseurl, failurl ]
+                if delayurl:
+                    cmd.append(delayurl)
+                res = json.loads(subprocess.check_output(cmd))
+                results.append(res)
+
+                def secs(t):
+                    return "%.3f" % t if t is not None else "-"
+                print fmt % (mix, concurrency,
+                             "%d/%d" % (res["succeeded"], res["requests"]),
+                             "%.1f" % res["requests_per_sec"],
+                             "%.2f" % res["mb_per_sec"],
+                             secs(res["p50_latency"]),
+                             secs(res["p99_latency"]),
+                             res["peak_rss_kb"])
+                sys.stdout.flush()
+    finally:
+        server.kill()
+
+    with open(outfile, "w") as fp:
+        json.dump({ "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+                    "results": results }, fp, indent=2)
+    print "Wrote", outfile
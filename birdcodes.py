@@ -17,12 +17,60 @@ import csv
 import io
 import sys, os
 import re
+import pickle
 
 from difflib import SequenceMatcher
+from collections import Counter
 
 class BirdCodes:
+    # The parsed tables are shared by every BirdCodes in a process,
+    # and cached on disk so CGI hits and commandline lookups don't have
+    # to parse the CSV lists every time. Build the cache with birdcodes.py -b
+    # (it's also written automatically the first time, if possible).
+    CACHEFILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "birdcodes.pickle")
+    tables = None
+
     def __init__(self):
-        self.allbirds = {}
+        if not BirdCodes.tables:
+            BirdCodes.tables = BirdCodes.load_tables()
+        self.allbirds, self.names, self.trigrams = BirdCodes.tables
+
+    @staticmethod
+    def load_tables():
+        """Return (allbirds, names, trigrams), from the cache file if it's
+           newer than this script, otherwise by parsing the CSV lists.
+        """
+        try:
+            if os.path.getmtime(BirdCodes.CACHEFILE) \
+               >= os.path.getmtime(os.path.abspath(__file__)):
+                with open(BirdCodes.CACHEFILE, "rb") as fp:
+                    return pickle.load(fp)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+
+        allbirds = BirdCodes.parse_csv()
+        tables = (allbirds,) + BirdCodes.build_index(allbirds)
+        try:
+            BirdCodes.write_cache(tables)
+        except OSError:
+            # Probably a CGI that can't write to its own directory.
+            pass
+        return tables
+
+    @staticmethod
+    def write_cache(tables):
+        tmpfile = BirdCodes.CACHEFILE + ".tmp"
+        with open(tmpfile, "wb") as fp:
+            pickle.dump(tables, fp, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmpfile, BirdCodes.CACHEFILE)
+
+    @staticmethod
+    def parse_csv():
+        """Parse and merge the two CSV lists.
+           Return a dict of { code: (name, sciname) }.
+        """
+        allbirds = {}
 
         # Start with the birds from birdpop.org:
         fp = io.StringIO(BirdCodes.birdpopcodes_csv)
@@ -39,9 +87,9 @@ class BirdCodes:
 
         for fields in reader:
             if sciname:
-                self.allbirds[fields[code4]] = (fields[name], fields[sciname])
+                allbirds[fields[code4]] = (fields[name], fields[sciname])
             else:
-                self.allbirds[fields[code4]] = (fields[name], '')
+                allbirds[fields[code4]] = (fields[name], '')
 
         fp.close()
 
@@ -59,14 +107,41 @@ class BirdCodes:
             sciname = None
 
         for fields in reader:
-            if fields[code4] in self.allbirds:
+            if fields[code4] in allbirds:
                 continue
             if sciname:
-                self.allbirds[fields[code4]] = (fields[name], fields[sciname])
+                allbirds[fields[code4]] = (fields[name], fields[sciname])
             else:
-                self.allbirds[fields[code4]] = (fields[name], '')
+                allbirds[fields[code4]] = (fields[name], '')
         fp.close()
 
+        return allbirds
+
+    @staticmethod
+    def build_index(allbirds):
+        """Build indices for matching names. Return (names, trigrams):
+           names maps uppercase names to codes, for exact matches,
+           and trigrams maps each 3-letter piece of a name to
+           the set of codes whose names contain it, for fuzzy matches.
+        """
+        names = {}
+        trigrams = {}
+        for code in allbirds:
+            name = allbirds[code][0].upper()
+            if name not in names:
+                names[name] = code
+            for tri in BirdCodes.name_trigrams(name):
+                trigrams.setdefault(tri, set()).add(code)
+        return names, trigrams
+
+    @staticmethod
+    def name_trigrams(name):
+        """The set of 3-character substrings of a name,
+           padded so short words and word starts count too.
+        """
+        name = '  ' + name + ' '
+        return set(name[i:i+3] for i in range(len(name) - 2))
+
     @staticmethod
     def makedic(code, name, sciname):
         ret = { "code": code, "name": name }
@@ -82,38 +157,136 @@ class BirdCodes:
                                      self.allbirds[matchcode][1])
         return None
 
-    def match_codes(self, matchcodes):
-        matches = []
-        for code in matchcode:
-            matches.append(self.match_code(code))
+    def match_codes(self, matchcodes, fuzzy=True):
+        """Look up a whole list of codes and names at once.
+           Four-letter strings are looked up as codes (falling back
+           to an exact name match, for birds like the Smew);
+           anything else goes to match_names().
+           Return a dict of { query: dic or None }, in the order given.
+        """
+        matches = {}
+        names = []
+        for code in matchcodes:
+            if len(code) == 4:
+                matches[code] = self.match_code(code)
+                if not matches[code]:
+                    matches[code] = self.match_names([code],
+                                                     fuzzy=False)[code]
+            else:
+                matches[code] = None
+                names.append(code)
+
+        if names:
+            matches.update(self.match_names(names, fuzzy))
+        return matches
+
+    def match_names(self, matchnames, fuzzy=True):
+        """Look up a list of bird names: exact matches first,
+           then all the misses get fuzzy-matched together.
+           Return a dict of { name: dic or None }, in the order given.
+        """
+        matches = {}
+        misses = []
+        for name in matchnames:
+            matches[name] = self.match_name(name, fuzzy=False)
+            if not matches[name]:
+                misses.append(name)
+
+        if fuzzy and misses:
+            best = self.fuzzy_match_many([ name.upper() for name in misses ])
+            for name in misses:
+                if name.upper() not in best:
+                    continue
+                ratio, b = best[name.upper()]
+                matches[name] = BirdCodes.makedic(b,
+                                                  self.allbirds[b][0],
+                                                  self.allbirds[b][1])
         return matches
 
     def match_name(self, matchname, fuzzy=True):
         matchname = matchname.upper()
-        for b in self.allbirds:
-            if self.allbirds[b][0].upper() == matchname:
-                return BirdCodes.makedic(b,
-                                         self.allbirds[b][0],
-                                         self.allbirds[b][1])
+        if matchname in self.names:
+            b = self.names[matchname]
+            return BirdCodes.makedic(b,
+                                     self.allbirds[b][0],
+                                     self.allbirds[b][1])
 
         # If we get here, we didn't find an exact match.
         # Should we try for a fuzzy match instead?
         if not fuzzy:
             return None
 
-        best_ratio = -1
-        best_match = None
-        for b in self.allbirds:
+        best = self.best_matches(matchname, 1)
+        if not best:
+            return None
+        return best[0][1]
+
+    def candidates(self, matchname, n=50):
+        """Return the codes of the n birds whose names share the most
+           trigrams with matchname (which should be uppercase):
+           the only ones worth a slow SequenceMatcher comparison.
+        """
+        shared = Counter()
+        for tri in BirdCodes.name_trigrams(matchname):
+            if tri in self.trigrams:
+                shared.update(self.trigrams[tri])
+        if shared:
+            # Sort ties by code, so results don't depend on set ordering.
+            return sorted(shared, key=lambda b: (-shared[b], b))[:n]
+
+        # Nothing in common at all: fall back to checking everything.
+        return list(self.allbirds.keys())
+
+    def best_matches(self, matchname, n=5, candidates=50):
+        """Fuzzy-match a name against all the bird names.
+           Rather than comparing against every bird, only the
+           candidates names sharing the most trigrams with matchname
+           get the (slow) SequenceMatcher comparison.
+           Return a list of the n best (ratio, dic), best first,
+           or an empty list if matchname is blank.
+        """
+        matchname = matchname.upper()
+        # A blank name has nothing to match, and would otherwise
+        # be compared against every bird.
+        if not matchname.strip():
+            return []
+
+        scored = []
+        for b in self.candidates(matchname, candidates):
             r = SequenceMatcher(None, matchname,
                                 self.allbirds[b][0].upper()).ratio()
-            if r > best_ratio:
-                # print "a little better:", b, self.allbirds[b]
-                best_match = b
-                best_ratio = r
+            scored.append((r, b))
+        scored.sort(key=lambda rb: (-rb[0], rb[1]))
+
+        return [ (r, BirdCodes.makedic(b,
+                                       self.allbirds[b][0],
+                                       self.allbirds[b][1]))
+                 for r, b in scored[:n] ]
+
+    def fuzzy_match_many(self, matchnames, candidates=50):
+        """Fuzzy-match several uppercase names in a single pass
+           over their candidate birds: each bird name is analyzed by
+           SequenceMatcher once, however many queries it's compared with.
+           Return a dict of { name: (ratio, code) } for the best match.
+           Blank names are left out.
+        """
+        wanted = {}
+        for name in set(matchnames):
+            if not name.strip():
+                continue
+            for b in self.candidates(name, candidates):
+                wanted.setdefault(b, []).append(name)
 
-        return BirdCodes.makedic(best_match,
-                                 self.allbirds[best_match][0],
-                                 self.allbirds[best_match][1])
+        best = {}
+        matcher = SequenceMatcher(None)
+        for b in wanted:
+            matcher.set_seq2(self.allbirds[b][0].upper())
+            for name in wanted[b]:
+                matcher.set_seq1(name)
+                r = matcher.ratio()
+                if name not in best or (-r, b) < (-best[name][0], best[name][1]):
+                    best[name] = (r, b)
+        return best
 
     # Another list (but no sci names) list at
     # http://infohost.nmt.edu/~shipman/z/nom/bblcodes
@@ -3401,14 +3574,100 @@ What codes do you want to look up? (Comma or space separated.)
 def print_bird_form():
     print(bird_form % (os.environ['HTTP_HOST'], os.environ['SCRIPT_NAME']))
 
-def bird_string(dic):
+def bird_string(dic, query=None):
     if not dic:
+        if query:
+            return "%s: Unknown" % query
         return "Unknown"
     if 'sciname' in dic:
         return '%s: %s (%s)' % (dic["code"], dic["name"], dic["sciname"])
     return '%s: %s' % (dic["code"], dic["name"])
 
+#
+# A long-running server, so the tables and indices are loaded just once
+# rather than on every CGI hit. application() can be used with any WSGI
+# server (mod_wsgi, gunicorn etc.), or run birdcodes.py -s [port]
+# to serve it with the threaded WSGI server built into Python.
+#
+# Queries: GET /?code=RTHA,WETA&name=canyon wren,steller's jay
+# or POST a JSON object like { "codes": [...], "names": [...] }.
+# The reply is JSON: { "codes": { code: match }, "names": { name: match } }
+# where each match is a dict with code, name and maybe sciname, or null.
+#
+
+wsgi_birdcodes = None
+
+def application(environ, start_response):
+    import json
+    from urllib.parse import parse_qs
+
+    global wsgi_birdcodes
+    if not wsgi_birdcodes:
+        wsgi_birdcodes = BirdCodes()
+
+    codes = []
+    names = []
+    try:
+        if environ.get('REQUEST_METHOD') == 'POST':
+            length = int(environ.get('CONTENT_LENGTH') or 0)
+            query = json.loads(environ['wsgi.input'].read(length) or '{}')
+            codes = query.get('codes', [])
+            names = query.get('names', [])
+            # A bare string would be matched one character at a time.
+            for lis in (codes, names):
+                if not isinstance(lis, list) or \
+                   not all(isinstance(s, str) for s in lis):
+                    raise ValueError("codes and names must be lists of strings")
+        else:
+            query = parse_qs(environ.get('QUERY_STRING', ''))
+            for val in query.get('code', []):
+                codes += re.findall(r"[\w']+", val)
+            for val in query.get('name', []):
+                names += [ n.strip() for n in val.split(',') if n.strip() ]
+    except (ValueError, AttributeError):
+        start_response('400 Bad Request',
+                       [ ('Content-Type', 'text/plain') ])
+        return [ b'Bad query\n' ]
+
+    result = {
+        'codes': wsgi_birdcodes.match_codes(codes),
+        'names': wsgi_birdcodes.match_names(names),
+    }
+    body = json.dumps(result).encode('utf-8')
+    start_response('200 OK', [ ('Content-Type', 'application/json'),
+                               ('Content-Length', str(len(body))) ])
+    return [ body ]
+
+def serve(port=8080):
+    import socketserver
+    from wsgiref.simple_server import make_server, WSGIServer, \
+                                      WSGIRequestHandler
+
+    class ThreadingWSGIServer(socketserver.ThreadingMixIn, WSGIServer):
+        daemon_threads = True
+
+    class QuietHandler(WSGIRequestHandler):
+        def log_message(self, *args):
+            pass
+
+    # Load the tables before taking any requests.
+    global wsgi_birdcodes
+    wsgi_birdcodes = BirdCodes()
+
+    httpd = make_server('', port, application,
+                        server_class=ThreadingWSGIServer,
+                        handler_class=QuietHandler)
+    print("Serving bird codes on port", port)
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
 if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '-s':
+        serve(int(sys.argv[2]) if len(sys.argv) > 2 else 8080)
+        sys.exit(0)
+
     import cgi
 
     birdcodes = BirdCodes()
@@ -3429,7 +3688,7 @@ if __name__ == '__main__':
         matches = birdcodes.match_codes(codes)
         print("<p>")
         for key in sorted(matches.keys()):
-            print(bird_string(key, matches[key][0], matches[key][1]))
+            print(bird_string(matches[key], key))
             print("<br>")
 
         print("<hr>")
@@ -3446,10 +3705,14 @@ if __name__ == '__main__':
         # cgi.print_environ()
         print(htmlfoot)
 
+    elif sys.argv[1:] == ['-b']:
+        # Rebuild the cache of parsed tables.
+        allbirds = BirdCodes.parse_csv()
+        BirdCodes.write_cache((allbirds,) + BirdCodes.build_index(allbirds))
+        print("Wrote", BirdCodes.CACHEFILE)
+
     else:
         # Not a CGI, called from the commandline.
-        for code in sys.argv[1:]:
-            if len(code) != 4:
-                print(bird_string(birdcodes.match_name(code)))
-            else:
-                print(bird_string(birdcodes.match_code(code)))
+        matches = birdcodes.match_codes(sys.argv[1:])
+        for code in matches:
+            print(bird_string(matches[code], code))
@@ -32,7 +32,7 @@ if 'count' in form :
     count = int(form["count"].value)
 else :
     count = 300
-print("Delay %d, count %d<br>" % (delay, count)
+print("Delay %g, count %d<br>" % (delay, count))
 
 for i in range(count) :
     time.sleep(delay)
@@ -26,20 +26,191 @@ import os, sys
 import time
 import datetime
 import re
+import copy
+import shutil
 import subprocess
+import threading
+import Queue
+import StringIO
 
 sys.path.insert(1, os.path.join(sys.path[0], '..'))
 import pycamera
 
 from PIL import Image
 
+# If numpy is available, compare images with array operations,
+# which is a couple hundred times faster than going pixel by pixel.
+try:
+    import numpy
+    have_numpy = True
+except ImportError:
+    have_numpy = False
+
+class SnapWriter:
+    '''Save snapshots in the background, so motion detection doesn't
+       stop while jpegtran runs or a slow network filesystem writes.
+       Snapshots are spooled into localdir first, then moved to
+       remotedir, if there is one, whenever it can be reached.
+    '''
+
+    # How long to wait before trying an unreachable remotedir again,
+    # doubling each time it fails, up to MAX_RETRY.
+    RETRY = 5
+    MAX_RETRY = 300
+
+    def __init__(self, localdir, remotedir=None, queuesize=8, verbose=0):
+        self.localdir = localdir
+        # If remotedir is really localdir, there's nothing to move,
+        # and "moving" would delete each snapshot after copying it
+        # onto itself.
+        if remotedir and os.path.realpath(remotedir) == \
+           os.path.realpath(localdir):
+            remotedir = None
+        self.remotedir = remotedir
+        self.verbose = verbose
+
+        # (filename, data, crop) waiting to be spooled,
+        # then filenames in localdir waiting to go to remotedir.
+        self.snapqueue = Queue.Queue(queuesize)
+        self.spooled = Queue.Queue()
+
+        self.spooler = threading.Thread(target=self.spool_snaps)
+        self.spooler.daemon = True
+        self.spooler.start()
+        if remotedir:
+            self.flusher = threading.Thread(target=self.flush_snaps)
+            self.flusher.daemon = True
+            self.flusher.start()
+        else:
+            self.flusher = None
+
+    def put(self, filename, data, crop=False):
+        '''Queue JPEG data to be cropped, if crop is a WxH+X+Y specifier,
+           and saved as filename. Doesn't block: if the writer
+           is too far behind, write the data to localdir uncropped
+           right away instead. Return True if it was queued.
+        '''
+        try:
+            self.snapqueue.put_nowait((filename, data, crop))
+            return True
+        except Queue.Full:
+            print "Snapshot writer is behind, saving", filename, "uncropped"
+            self.spool(filename, data)
+            return False
+
+    def close(self, timeout=10):
+        '''Finish saving queued snapshots, and try once more
+           to move them to remotedir.
+        '''
+        self.snapqueue.put((None, None, None))
+        self.spooler.join(timeout)
+        if self.flusher:
+            self.spooled.put(None)
+            self.flusher.join(timeout)
+
+    def spool_snaps(self):
+        while True:
+            filename, data, crop = self.snapqueue.get()
+            if filename is None:
+                return
+            if crop:
+                data = self.crop(data, crop)
+            self.spool(filename, data)
+
+    def crop(self, data, crop):
+        '''Crop JPEG data losslessly with jpegtran.'''
+        if self.verbose:
+            print "Cropping"
+        # jpegtran can only write to stdout so we'll have to
+        # write it to the file ourselves.
+        p = subprocess.Popen(['/usr/bin/jpegtran', '-crop', crop],
+                             shell=False,
+                             stdin=subprocess.PIPE,
+                             stdout=subprocess.PIPE)
+        return p.communicate(input=data)[0]
+
+    def spool(self, filename, data):
+        path = os.path.join(self.localdir, filename)
+        try:
+            # Write to a .part file, so a half-written file
+            # never gets flushed.
+            with open(path + '.part', 'wb') as fp:
+                fp.write(data)
+            os.rename(path + '.part', path)
+        except (IOError, OSError), e:
+            print "Couldn't save", path, ":", e
+            return
+        if self.flusher:
+            self.spooled.put(filename)
+        else:
+            print "Saved", path
+        sys.stdout.flush()
+
+    def flush_snaps(self):
+        '''Move spooled snapshots to remotedir, retrying with backoff
+           while it's unreachable. Runs in its own thread, since writing
+           to a network filesystem can take a very long time to fail.
+        '''
+        pending = []
+        retry = self.RETRY
+        # Don't try remotedir again before this time, however many
+        # new snapshots arrive: that would hammer a hung mount.
+        next_attempt = 0
+        closing = False
+        while True:
+            if pending:
+                timeout = max(0, next_attempt - time.time())
+            else:
+                timeout = None
+            try:
+                filename = self.spooled.get(timeout=timeout)
+                if filename is None:
+                    closing = True
+                else:
+                    pending.append(filename)
+            except Queue.Empty:
+                pass
+
+            # When closing, have one last try regardless.
+            if not closing and time.time() < next_attempt:
+                continue
+
+            while pending:
+                localpath = os.path.join(self.localdir, pending[0])
+                remotepath = os.path.join(self.remotedir, pending[0])
+                try:
+                    shutil.copyfile(localpath, remotepath + '.part')
+                    os.rename(remotepath + '.part', remotepath)
+                    os.unlink(localpath)
+                except (IOError, OSError), e:
+                    retry = min(retry * 2, self.MAX_RETRY)
+                    next_attempt = time.time() + retry
+                    print "Couldn't move %s to %s (%s), retrying in %d sec" \
+                        % (pending[0], self.remotedir, str(e), retry)
+                    break
+                print "Saved", remotepath
+                sys.stdout.flush()
+                pending.pop(0)
+                retry = self.RETRY
+
+            if closing:
+                if pending:
+                    print "Leaving", len(pending), "snapshots in", \
+                        self.localdir
+                return
+
 class MotionDetector:
+    # If the camera stops streaming, wait 2, 4, 8 ... seconds before
+    # restarting it, and give up and take stills after this many
+    # failures in a row.
+    MAX_STREAM_FAILURES = 5
+
     def __init__(self,
                  test_res=[320, 240], pir=None, rangefinder=False,
                  threshold=30, sensitivity=0,
                  test_borders=None, full_res=None,
                  localdir=None, remotedir=None,
-                 crop=False, verbose=0):
+                 crop=False, stream=False, adapt=.05, verbose=0):
         '''test_res: resolution of test images to be compared.
               XXX Can't we get that from the images passed in?
            threshold: How different does a pixel need to be?
@@ -69,10 +240,19 @@ class MotionDetector:
                                [[68,85],[48,75]], [[86,100],[41,75]] ]
            crop: you may pass in a WxH+X+Y specifier, False (don't crop
                at all), or '-' (crop to match the test borders)
+           adapt: how fast the background model follows the scene,
+               from 0 to 1, when numpy is available. Each new frame is
+               compared with a running average of the earlier ones,
+               not just the one before it; higher adapt means older
+               frames are forgotten faster.
+           stream: keep the low-res camera open and compare frames
+               as fast as it produces them, rather than taking
+               a separate still each time, if the camera supports it.
         '''
         self.verbose = verbose
         self.localdir = localdir
         self.remotedir = remotedir
+        self.writer = SnapWriter(localdir, remotedir, verbose=verbose)
 
         # Do we have any sensors specified?
         self.pir = None
@@ -123,6 +303,15 @@ class MotionDetector:
 
         self.bufold = None
 
+        # For the numpy path: a background model, the per-pixel running
+        # mean and variance of the green channel, as float arrays;
+        # and a boolean mask of the pixels inside the test borders.
+        self.adapt = adapt
+        self.background = None
+        self.variance = None
+        self.test_mask = None
+        self.mask_borders = None
+
         # What cameras are available? We may use a different camera
         # for the regular low-res test images vs. the high-res snaps.
         cams = pycamera.find_cameras(self.verbose)
@@ -201,7 +390,36 @@ class MotionDetector:
         else:
             self.use_tmp_file = False
 
+        # Stream test frames from the low-res camera?
+        self.frames = None
+        self.stream_failures = 0
+        self.stream = stream and self.sensitivity
+        if self.stream:
+            self.start_stream()
+
+    def start_stream(self):
+        '''Start the low-res camera streaming frames into self.frames.
+           If it can't stream, fall back to taking stills.
+        '''
+        try:
+            self.frames = self.locam.stream_frames(res=self.test_res)
+            if self.verbose:
+                print "Streaming test frames from", \
+                    str(self.locam.__class__)
+        except (AttributeError, NotImplementedError), e:
+            print "Can't stream test frames (%s), taking stills instead" \
+                % str(e)
+            self.frames = None
+            self.stream = False
+
+    def stop_stream(self):
+        if self.frames:
+            self.frames.close()
+            self.frames = None
+
     def cleanup(self):
+        self.stop_stream()
+        self.writer.close()
         if self.pir or self.rangefinder:
             import RPi.GPIO as GPIO
             if self.verbose:
@@ -214,12 +432,19 @@ class MotionDetector:
            and writing to ssh filesystems that you should expect
            at least 10 seconds per loop in overhead, on top of any
            delay you pass in.
+           When streaming, there's no such overhead, and each step
+           waits for a new frame anyway, so secs can be 0.
         '''
         while True:
             self.step()
             # flush stdout, since we may be logging to a file.
             sys.stdout.flush()
-            time.sleep(secs)
+            # If streaming gave up and fell back to stills,
+            # don't take them as fast as possible.
+            if not self.frames:
+                time.sleep(max(secs, 1))
+            else:
+                time.sleep(secs)
 
     def step(self):
         '''Check camera snapshot or motion sensors to decide
@@ -228,17 +453,36 @@ class MotionDetector:
         if self.verbose:
             print ""    # Blank line so we can tell when each step starts
         if self.sensitivity:
-            if self.use_tmp_file:
+            img_data = None
+            if self.frames:
+                im = self.frames.latest(timeout=10)
+                if not im:
+                    self.stop_stream()
+                    self.stream_failures += 1
+                    if self.stream_failures >= self.MAX_STREAM_FAILURES:
+                        print "Camera keeps failing to stream, " \
+                            "taking stills instead"
+                        self.stream = False
+                        return
+                    delay = 2 ** self.stream_failures
+                    print "Camera stopped streaming, restarting it in", \
+                        delay, "seconds"
+                    time.sleep(delay)
+                    self.start_stream()
+                    return
+                self.stream_failures = 0
+            elif self.use_tmp_file:
                 tmpfile = "/tmp/still.jpg"
-                self.locam.take_still(outfile=tmpfile, res=test_res)
+                self.locam.take_still(outfile=tmpfile, res=self.test_res)
                 im = Image.open(tmpfile)
-                img_data = None
             else:   # keep it all in memory, no temp files
-                img_data = self.locam.take_still(outfile='-', res=test_res)
+                img_data = self.locam.take_still(outfile='-',
+                                                 res=self.test_res)
                 im = Image.open(img_data)
 
             different, debugimg = self.compare_images(im)
-            print "Different?", different
+            if self.verbose or not self.stream:
+                print "Different?", different
 
             if img_data:
                 img_data.close()
@@ -266,89 +510,48 @@ class MotionDetector:
 
         # If we get here, everything says there's motion.
         # So take a full-res snapshot.
-        self.snap_full_res()
-
-    def get_outdir(self):
-        '''Does the remotedir exist and is it still accessible?
-           We check this every time, since a remote filesystem
-           could disappear at any moment, in which case we'll want
-           to revert to a local directory.
-        '''
-        if self.remotedir and os.access(self.remotedir, os.W_OK):
-            return self.remotedir
+        # If that needs the camera we're streaming from,
+        # it has to be let go for a moment.
+        if self.frames and self.hicam is self.locam:
+            self.stop_stream()
+            self.snap_full_res()
+            self.start_stream()
         else:
-            return self.localdir
-
-    def get_snap_path(self, fileroot):
-        '''If there's been motion, snap a high-res photo.'''
-
-        # Use the remote directory if possible.
-        # But check for that every time, since the network might go down.
-        snapdir = self.get_outdir()
-        if not snapdir:
-            print "Not snapping full resolution, couldn't get output dir"
-            return None
+            self.snap_full_res()
 
+    def snap_filename(self, fileroot):
         now = datetime.datetime.now()
-        snapfile = '%s-%02d-%02d-%02d-%02d-%02d-%02d.jpg' % \
+        return '%s-%02d-%02d-%02d-%02d-%02d-%02d.jpg' % \
             (fileroot,
              now.year, now.month, now.day,
              now.hour, now.minute, now.second)
-        return os.path.join(snapdir, snapfile)
 
     def snap_full_res(self):
+        '''If there's been motion, snap a high-res photo.
+           Only the capture happens here; cropping and saving
+           happen in the background, in self.writer.
+        '''
         # XXX May want to save the first image with a fileroot of "first".
-        snappath = self.get_snap_path("snap")
-        if not snappath:
-            return
-
-        if self.crop:
-            # Snap data to memory, then pass it to jpegtran to crop.
-            # jpegtran can only write to stdout so we'll have to
-            # write it to the file ourselves.
-            if self.verbose:
-                print "Cropping"
-            if self.use_tmp_file:
-                tmpfile = "/tmp/still.jpg"
-                img_data = self.hicam.take_still(outfile=tmpfile,
-                                                 res=self.full_res,
-                                                 format='jpg')
-                p = subprocess.Popen(["/usr/bin/jpegtran",
-                                      "-crop", self.crop,
-                                      tmpfile],
-                                     shell=False,
-                                     stdout=subprocess.PIPE)
-                img_data = p.communicate()[0]
-            else:
-                img_data = self.hicam.take_still(outfile='-',
-                                                 res=self.full_res,
-                                                 format='jpg')
-                # img_data is a StringIO instance.
-                # But Popen can't take a StringIO as input;
-                # instead, have to write the data into a pipe.
-                p = subprocess.Popen(['/usr/bin/jpegtran',
-                                      '-crop', self.crop],
-                                     shell=False,
-                                     stdin=subprocess.PIPE,
-                                     stdout=subprocess.PIPE)
-                # Better to use communicate() than write()
-                img_data = p.communicate(input=img_data.getvalue())[0]
-                # Or use img_data.read() instead of getvalue --
-                # not clear if there's any efficiency difference since
-                # we have to keep the whole string in mem either way.
-                p.stdin.close()
-            snapout = open(snappath, 'w')
-            snapout.write(img_data)
-            snapout.close()
-            p = None
-            print "Saved high-res cropped still", snappath
+        snapfile = self.snap_filename("snap")
+
+        if self.use_tmp_file:
+            # gphoto can only capture to a file.
+            tmpfile = "/tmp/still.jpg"
+            self.hicam.take_still(outfile=tmpfile, res=self.full_res)
+            with open(tmpfile, 'rb') as fp:
+                img_data = fp.read()
         else:
-            self.hicam.take_still(outfile=snappath, res=self.full_res)
-            print "Saving high-res to", snappath
-
+            img_data = self.hicam.take_still(outfile='-',
+                                             res=self.full_res,
+                                             format='jpg')
+            # img_data is a StringIO instance.
+            img_data = img_data.getvalue()
+
+        if self.writer.put(snapfile, img_data, self.crop):
+            print "Snapped high-res still", snapfile
         sys.stdout.flush()
 
-        return snappath
+        return snapfile
 
     def compare_images(self, new_image):
         '''Compare a new image (a PIL.Image) with the previous one.
@@ -358,8 +561,60 @@ class MotionDetector:
            otherwise None.
            We'll remember the pixel data from the previous image.
         '''
+        if have_numpy:
+            # The background model copes with changing light by itself.
+            changed_pixels, debugimage = \
+                self.count_changes_numpy(new_image, self.threshold)
+        else:
+            # XXX Modify threshold for time of day. Obviously this isn't
+            # the right way to do it, and it should be done by light levels.
+            # Night is after 20:45 or before 5:30.
+            now = datetime.datetime.now()
+            minutes = now.hour * 60 + now.minute
+            if minutes > 20 * 60 + 45 or minutes < 5 * 60 + 30:
+                threshold = self.threshold / 3
+            else:
+                threshold = self.threshold
+            changed_pixels, debugimage = self.count_changes_pil(new_image,
+                                                                threshold)
+
+        # No previous image to compare with, first time through?
+        if changed_pixels is None:
+            return False, None
+
+        changed = changed_pixels > self.sensitivity
+
+        if changed:
+            print "=====================", changed_pixels, "pixels changed"
+
+            if self.save_debug_image:
+                debugfile = self.snap_filename("debug")
+                print "Saving debug image to", debugfile
+                buf = StringIO.StringIO()
+                debugimage.save(buf, 'JPEG')
+                self.writer.put(debugfile, buf.getvalue())
+
+        elif self.verbose:
+            print changed_pixels, "pixels changed, not enough\t",
+            print str(datetime.datetime.now())
+
+        return changed, debugimage
+
+    def count_changes_pil(self, new_image, threshold):
+        '''Count the pixels inside the test borders that differ by more
+           than threshold from the previous image, going pixel by pixel.
+           Slow, but doesn't need numpy.
+           Return changed_pixels, debugimage; changed_pixels is None
+           if there's no previous image yet.
+        '''
         bufnew = new_image.load()
 
+        # If bufold isn't set yet, it's our first time through.
+        # All we can do is copy it to prepare for the next time.
+        if not self.bufold:
+            self.bufold = bufnew
+            return None, None
+
         if self.save_debug_image:
             debugimage = new_image.copy()
             debug_buf = debugimage.load()
@@ -367,21 +622,6 @@ class MotionDetector:
             debugimage = None
             debug_buf = None
 
-        # XXX Modify threshold for time of day. Obviously this isn't
-        # the right way to do it, and it should be done by light levels.
-        now = datetime.datetime.now()
-        if (now.hour > 20 and now.minute > 45) or \
-           (now.hour <= 5 and now.minute < 30):
-            threshold = self.threshold / 3
-        else:
-            threshold = self.threshold
-
-        # If bufold isn't set yet, it's our first time through.
-        # All we can do is copy it to prepare for the next time.
-        if not self.bufold:
-            self.bufold = bufnew
-            return False, None
-
         changed_pixels = 0
         for piece in self.test_borders:
             for x in xrange(piece[0][0]-1, piece[0][1]):
@@ -416,18 +656,103 @@ class MotionDetector:
 
         self.bufold = bufnew
 
-        if changed:
-            print "=====================", changed_pixels, "pixels changed"
+        return changed_pixels, debugimage
 
-            if self.save_debug_image:
-                print "Saving debug image to", self.get_snap_path("debug")
-                debugimage.save(self.get_snap_path("debug"))
+    def make_test_mask(self, width, height):
+        '''Make a boolean array, height x width, that's True for
+           every pixel inside one of the test borders.
+        '''
+        mask = numpy.zeros((height, width), dtype=bool)
+        for piece in self.test_borders:
+            # test_borders are 1-based and inclusive.
+            mask[piece[1][0]-1:piece[1][1], piece[0][0]-1:piece[0][1]] = True
+        return mask
+
+    # How many standard deviations from the background a pixel has to be
+    # before it counts as changed.
+    NOISE_SIGMAS = 3
+
+    def count_changes_numpy(self, new_image, threshold):
+        '''Like count_changes_pil, but compare the green channel,
+           as a numpy array, with a background model built up
+           from the earlier images, all at once.
+           A pixel has changed if it's more than threshold, and more
+           than NOISE_SIGMAS standard deviations, from the background;
+           so pixels that are always changing, like leaves blowing in
+           the wind, need a bigger change to count.
+           The image is scaled to the background's average brightness
+           first, so a cloud or a camera's auto-exposure doesn't look
+           like motion.
+           Return changed_pixels, debugimage; changed_pixels is None
+           if there's no previous image yet.
+        '''
+        # Just check green channel as it's the highest quality.
+        green = numpy.array(new_image.split()[1], dtype=numpy.float32)
+
+        # First time through, or has the image size changed?
+        # Then there's nothing to compare with yet.
+        if self.background is None or self.background.shape != green.shape:
+            self.background = green
+            self.variance = numpy.zeros(green.shape, dtype=numpy.float32)
+            self.test_mask = None
+            return None, None
+
+        # The test borders can be changed on the fly, e.g. by dragging
+        # in gmotion_detect, so remember which ones the mask is for.
+        if self.test_mask is None or self.mask_borders != self.test_borders:
+            self.test_mask = self.make_test_mask(green.shape[1],
+                                                 green.shape[0])
+            self.mask_borders = copy.deepcopy(self.test_borders)
+
+        # Normalize brightness to the background's.
+        brightness = green[self.test_mask].mean()
+        if brightness > 0:
+            green *= self.background[self.test_mask].mean() / brightness
+
+        delta = green - self.background
+        limit = numpy.maximum(threshold,
+                              self.NOISE_SIGMAS * numpy.sqrt(self.variance))
+        diffs = numpy.abs(delta) > limit
+        diffs &= self.test_mask
+        changed_pixels = int(numpy.count_nonzero(diffs))
+
+        # Update the background. Changed pixels are taken in much
+        # more slowly, so something moving through doesn't become
+        # part of the background, but something that stays eventually does.
+        rate = numpy.where(diffs, self.adapt * self.adapt, self.adapt)
+        self.background += rate * delta
+        self.variance += rate * (delta * delta - self.variance)
+
+        if not self.save_debug_image:
+            return changed_pixels, None
 
-        elif self.verbose:
-            print changed_pixels, "pixels changed, not enough\t",
-            print str(datetime.datetime.now())
+        changed = changed_pixels > self.sensitivity
+        height, width = self.test_mask.shape
+        debug = numpy.array(new_image.convert('RGB'))
 
-        return changed, debugimage
+        # Changed pixels -> green
+        debug[diffs] = (0, 255, 0)
+
+        # Draw blue borders around the test areas no matter what,
+        # and add white borders outside them if something has changed.
+        for piece in self.test_borders:
+            left, right = piece[0][0]-1, piece[0][1]
+            top, bottom = piece[1][0]-1, piece[1][1]
+            debug[top, left:right] = (0, 0, 255)
+            debug[bottom-1, left:right] = (0, 0, 255)
+            debug[top:bottom, left] = (0, 0, 255)
+            debug[top:bottom, right-1] = (0, 0, 255)
+            if changed:
+                if top > 0:
+                    debug[top-1, left:right] = (255, 255, 255)
+                if bottom < height:
+                    debug[bottom, left:right] = (255, 255, 255)
+                if left > 0:
+                    debug[top:bottom, left-1] = (255, 255, 255)
+                if right < width:
+                    debug[top:bottom, right] = (255, 255, 255)
+
+        return changed_pixels, Image.fromarray(debug)
 
 # Sample usage:
 # motion_detect.py -v -s 250 -t 30 -r 320x240 -b 100x100+130+85 -c - /tmp ~pi/trade/snapshots/
@@ -481,6 +806,15 @@ Specify Raspberry Pi pin number, e.g. 7.""")
                         help="""Use a HC_SR04 rangefinder.
 Assumes pins 23 for trigger, 24 for echo.""")
 
+    parser.add_argument("-a", "--adapt", type=float, default=.05,
+                        help="""How fast the background model adapts
+to changes in the scene, 0 to 1. Default .05. Needs numpy.""")
+
+    parser.add_argument("-S", "--stream", action='store_true', default=False,
+                        help="""Keep the camera open and check every frame,
+rather than taking a separate test photo each time.
+Needs picamera, or avconv/ffmpeg for a USB webcam.""")
+
     parser.add_argument("-v", "--verbose", action='store_true', default=False,
         help="Verbose: chatter about what the program is doing.")
 
@@ -561,7 +895,7 @@ Assumes pins 23 for trigger, 24 for echo.""")
         print
         print "Parameters:"
         for param in ('sensitivity', 'threshold', 'resolution', 'fullres',
-                      'pir',
+                      'pir', 'stream', 'adapt',
                       'borders', 'crop', 'verbose', 'localdir', 'remotedir'):
             if vars(args)[param]:
                 print '  %s: %s' % (param, vars(args)[param])
@@ -576,10 +910,15 @@ Assumes pins 23 for trigger, 24 for echo.""")
                         full_res=args.fullres,
                         localdir=args.localdir,
                         remotedir=args.remotedir,
-                        crop=args.crop, verbose=args.verbose)
+                        crop=args.crop, stream=args.stream,
+                        adapt=args.adapt,
+                        verbose=args.verbose)
 
     try:
-        md.loop(1)
+        if md.stream:
+            md.loop(0)
+        else:
+            md.loop(1)
 
     except KeyboardInterrupt:
         print "Interrupt: exiting"
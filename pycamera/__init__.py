@@ -8,6 +8,9 @@
                         # assigned that incorporates the data and time.
                         # take_still's other arguments will vary
                         # with the capability of the camera library.
+   stream_frames(res)   # Optional: keep the camera open and return a
+                        # framering.FrameRing of recent low-res frames.
+                        # Raises NotImplementedError if it can't.
 
     There may also be other routines, like take_video().
 '''
@@ -15,7 +18,7 @@
 __version__ = "0.1"
 __author__ = "Akkana Peck <akkana@shallowsky.com>"
 __license__ = "GPL v2"
-__all__ = [ 'gphoto', "webcam", "piphoto" ]
+__all__ = [ 'gphoto', "webcam", "piphoto", "framering" ]
 
 # from . import *
 
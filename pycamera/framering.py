@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+
+# Copyright (C) 2014 Akkana Peck <akkana@shallowsky.com>
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA 02111-1307, USA.
+
+#
+# Keep a camera open and hold on to the last few frames it produced,
+# so motion detection can look at a recent frame whenever it's ready,
+# without starting the camera up again or going through a file.
+#
+
+import threading
+import collections
+
+class FrameRing:
+    '''Read frames (PIL Images) from a generator in a background thread,
+       keeping only the most recent few. The camera never waits for
+       the consumer; if the consumer is slow, old frames get dropped.
+       The generator should release the camera when it's closed.
+       stop, if given, is called on close() to interrupt the generator
+       if it's blocked waiting on the camera, e.g. by killing the
+       process it's reading from.
+    '''
+
+    def __init__(self, frames, size=4, stop=None):
+        self.frames = frames
+        self.stop = stop
+        self.ring = collections.deque(maxlen=size)
+        self.cond = threading.Condition()
+        self.nframes = 0        # Frames read so far
+        self.nseen = 0          # Value of nframes at the last latest()
+        self.closing = False
+        self.done = False
+
+        self.thread = threading.Thread(target=self.reader)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def reader(self):
+        try:
+            for frame in self.frames:
+                with self.cond:
+                    self.ring.append(frame)
+                    self.nframes += 1
+                    self.cond.notify_all()
+                if self.closing:
+                    break
+        finally:
+            # Closing the generator from its own thread lets it
+            # shut the camera down.
+            self.frames.close()
+            with self.cond:
+                self.done = True
+                self.cond.notify_all()
+
+    def latest(self, timeout=None):
+        '''Wait for a frame newer than the last one returned, and return it.
+           Return None if the camera has stopped, or on timeout.
+        '''
+        with self.cond:
+            if self.nframes == self.nseen and not self.done:
+                self.cond.wait(timeout)
+            if self.nframes == self.nseen:
+                return None
+            self.nseen = self.nframes
+            return self.ring[-1]
+
+    def recent(self):
+        '''Return a list of the frames still in the ring, oldest first.'''
+        with self.cond:
+            return list(self.ring)
+
+    def __iter__(self):
+        while True:
+            frame = self.latest()
+            if frame is None:
+                return
+            yield frame
+
+    def close(self, timeout=5):
+        '''Stop reading frames and wait for the camera to be released.'''
+        self.closing = True
+        if self.stop:
+            self.stop()
+        self.thread.join(timeout)
@@ -29,6 +29,8 @@ import StringIO
 import io
 from PIL import Image
 
+from framering import FrameRing
+
 # Used to import this in PiCamera's __init__, but then the module
 # isn't available outside that function.
 # So we need to import it here and use a global variable, sigh.
@@ -130,6 +132,41 @@ class PiCamera:
             # Is this needed? What does previewing mean?
             camera.stop_preview()
 
+    def stream_frames(self, res=[320, 240], ringsize=4):
+        '''Keep the camera open and capture low-res frames continuously
+           from the video port. Returns a FrameRing: iterate over it,
+           or call latest(), to get recent frames as PIL Images.
+           Close it to release the camera.
+           Needs the picamera module; raspistill can't stream.
+        '''
+        if not self.use_picamera:
+            raise NotImplementedError, \
+                "Streaming frames needs the picamera module"
+        return FrameRing(self.frames_picamera(res), ringsize)
+
+    def frames_picamera(self, res):
+        '''Generate frames from the picamera video port, as PIL Images.'''
+        if self.verbose:
+            print "Streaming %dx%d frames with picamera module" % tuple(res)
+
+        # picamera pads raw RGB captures out to a multiple of
+        # 32 pixels wide and 16 high.
+        padded = ((res[0] + 31) // 32 * 32, (res[1] + 15) // 16 * 16)
+        stream = io.BytesIO()
+
+        with picamera.PiCamera() as camera:
+            camera.resolution = res
+            # Camera warm-up time
+            time.sleep(2)
+            for foo in camera.capture_continuous(stream, format='rgb',
+                                                 use_video_port=True):
+                im = Image.frombytes('RGB', padded, stream.getvalue())
+                if padded != tuple(res):
+                    im = im.crop((0, 0, res[0], res[1]))
+                yield im
+                stream.seek(0)
+                stream.truncate()
+
     def take_video_picamera(self, outfile='/tmp/video.h264',
                    res=[640, 480], format=None):
         '''This routine is untested and probably broken.'''
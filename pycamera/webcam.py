@@ -18,6 +18,13 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA 02111-1307, USA.
 
+import os
+import subprocess
+import StringIO
+from PIL import Image
+
+from framering import FrameRing
+
 class WebCam:
 
     def __init__(self, verbose=False):
@@ -80,6 +87,56 @@ class WebCam:
 
         print "fswebcam failed! Error code %d" % rv
 
+    def stream_frames(self, res=[320, 240], ringsize=4):
+        '''Keep the camera open, reading raw frames from a long-running
+           avconv or ffmpeg. Returns a FrameRing: iterate over it,
+           or call latest(), to get recent frames as PIL Images.
+           Close it to release the camera.
+        '''
+        for prog in ('/usr/bin/avconv', '/usr/bin/ffmpeg'):
+            if os.path.exists(prog):
+                break
+        else:
+            raise NotImplementedError, \
+                "Streaming frames needs avconv or ffmpeg"
+        proc = self.start_pipe(prog, res)
+
+        def stop():
+            # Unblocks frames_pipe if it's waiting for a frame.
+            if proc.poll() is None:
+                try:
+                    proc.kill()
+                except OSError:
+                    pass
+
+        return FrameRing(self.frames_pipe(proc, res), ringsize, stop=stop)
+
+    def start_pipe(self, prog, res):
+        '''Start avconv or ffmpeg writing raw RGB frames to its stdout.'''
+        size = '%dx%d' % tuple(res)
+        # Ask the camera for res, and scale to it in case it
+        # picks something else.
+        args = [ prog, '-loglevel', 'quiet',
+                 '-f', 'video4linux2', '-s', size, '-i', '/dev/video0',
+                 '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', size, '-' ]
+        if self.verbose:
+            print "Streaming frames:", args
+        return subprocess.Popen(args, stdout=subprocess.PIPE)
+
+    def frames_pipe(self, proc, res):
+        '''Generate frames from a video4linux pipe, as PIL Images.'''
+        framesize = res[0] * res[1] * 3
+        try:
+            while True:
+                data = proc.stdout.read(framesize)
+                if len(data) < framesize:
+                    return
+                yield Image.frombytes('RGB', tuple(res), data)
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+
     def take_video(still=True, outfile='/tmp/still.jpg',
                             seconds=10, format=None):
         # Rupa's pidoorbell_recognizer used:
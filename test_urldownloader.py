@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+
+# Tests for urldownloader.py's retries, against a little HTTP server
+# running in this process.
+#
+# Usage: python test_urldownloader.py
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import BaseHTTPServer
+import SocketServer
+
+from urldownloader import UrlDownloadQueue, UrlDownloader
+
+class FlakyHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    '''Answer 503 the first time each path is requested, then succeed.'''
+    protocol_version = "HTTP/1.1"
+    hits = {}
+
+    def do_GET(self):
+        n = FlakyHandler.hits[self.path] = \
+            FlakyHandler.hits.get(self.path, 0) + 1
+        if n == 1:
+            self.send_response(503)
+            self.send_header("Retry-After", "1")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = "body of %s\n" % self.path
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class ThreadingServer(SocketServer.ThreadingMixIn,
+                      BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+class RetryTests(unittest.TestCase):
+    def setUp(self):
+        FlakyHandler.hits = {}
+        self.server = ThreadingServer(('127.0.0.1', 0), FlakyHandler)
+        self.baseurl = "http://127.0.0.1:%d" % self.server.server_address[1]
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.tmpdir)
+
+    def test_transient_failure_then_success(self):
+        dlqueue = UrlDownloadQueue(maxthreads=2, backoff=.1)
+        for name in ("a", "b"):
+            dlqueue.add(url="%s/%s" % (self.baseurl, name),
+                        localpath=os.path.join(self.tmpdir, name))
+
+        done = list(dlqueue.as_completed())
+        dlqueue.connpool.close()
+        self.assertEqual(len(done), 2)
+        self.assertTrue(dlqueue.wait(timeout=0))
+        for urldl in done:
+            self.assertEqual(urldl.status, UrlDownloader.SUCCESS)
+            self.assertEqual(urldl.tries, 2)
+            self.assertIsNone(urldl.errmsg)
+        self.assertEqual(open(os.path.join(self.tmpdir, "a")).read(),
+                         "body of /a\n")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,19 +4,20 @@
 
 # TODO:
 # - Catch and save errors
-# - UrlDownloadQueue: keep track of what's new, in progress,
-#   successfully downloaded, and errored, and have queries for them.
-# - UrlDownloadQueue: handle different servers differently,
-#   not overloading any one server with two many downloads,
-#   looking for a new server if one is already being hit but
-#   we have a new thread pool available.
 
 import sys
 import urllib2
+import httplib
 import socket
+import threading
+import collections
+import random
+import time
+import Queue
 from cookielib import CookieJar
-import StringIO
-import gzip
+import os
+import zlib
+import json
 import datetime
 import traceback
 
@@ -27,9 +28,163 @@ from multiprocessing.dummy import Pool as ThreadPool
 
 DEBUG=sys.stderr
 
+class NoContentError(Exception):
+    pass
+
+class ConnectionPool:
+    '''Idle persistent (keep-alive) HTTP connections, kept per host
+       so successive downloads from the same server can reuse them
+       instead of opening a new TCP (and maybe TLS) connection each time.
+       Thread safe.
+    '''
+    def __init__(self, maxidle=4):
+        self.maxidle = maxidle      # idle connections to keep per host
+        self.idle = {}
+        self.lock = threading.Lock()
+
+    def get(self, http_class, host, timeout, fresh=False):
+        '''Return an idle connection to host if there is one
+           (and fresh isn't set), otherwise a new one.
+        '''
+        key = (http_class, host)
+        with self.lock:
+            if self.idle.get(key) and not fresh:
+                conn = self.idle[key].pop()
+                conn.reused = True
+                conn.timeout = timeout
+                if conn.sock:
+                    conn.sock.settimeout(timeout)
+                return conn
+        conn = http_class(host, timeout=timeout)
+        conn.poolkey = key
+        conn.reused = False
+        return conn
+
+    def put(self, conn):
+        '''Return a connection whose response has been read completely.
+        '''
+        with self.lock:
+            conns = self.idle.setdefault(conn.poolkey, [])
+            if len(conns) < self.maxidle:
+                conns.append(conn)
+                return
+        conn.close()
+
+    def close(self):
+        with self.lock:
+            for conns in self.idle.values():
+                for conn in conns:
+                    conn.close()
+            self.idle = {}
+
+class PooledResponseFile:
+    '''File object for a response on a pooled connection.
+       Once the body has been read completely, the connection
+       goes back to the pool; if it's closed early, it's dropped.
+    '''
+    def __init__(self, response, conn, pool):
+        self.response = response
+        self.conn = conn
+        self.pool = pool
+
+    def read(self, amt=None):
+        if amt is None:
+            data = self.response.read()
+        else:
+            data = self.response.read(amt)
+        if self.response.isclosed():
+            self.release()
+        return data
+
+    def readline(self):
+        line = self.response.fp.readline() if self.response.fp else ''
+        if not line:
+            self.release()
+        return line
+
+    def release(self):
+        if not self.conn:
+            return
+        if self.response.isclosed() and not self.response.will_close:
+            self.pool.put(self.conn)
+        else:
+            self.conn.close()
+        self.conn = None
+
+    def close(self):
+        if self.response.length == 0 and not self.response.isclosed():
+            # e.g. a 304 Not Modified: nothing to read, connection reusable.
+            self.response.read()
+        self.release()
+        self.response.close()
+
+class KeepAliveHandler(urllib2.HTTPHandler, urllib2.HTTPSHandler):
+    '''A urllib2 handler that sends requests over keep-alive
+       connections from a ConnectionPool, rather than urllib2's
+       usual new connection with "Connection: close" every time.
+    '''
+    def __init__(self, pool):
+        urllib2.HTTPHandler.__init__(self)
+        urllib2.HTTPSHandler.__init__(self)
+        self.pool = pool
+
+    def http_open(self, req):
+        return self.pooled_open(httplib.HTTPConnection, req)
+
+    def https_open(self, req):
+        return self.pooled_open(httplib.HTTPSConnection, req)
+
+    def send(self, conn, req, headers):
+        '''Send req on conn and return the response.
+           If that fails, close conn and raise the error,
+           socket errors as URLError like urllib2 does.
+        '''
+        try:
+            conn.request(req.get_method(), req.get_selector(),
+                         req.data, headers)
+            return conn.getresponse(buffering=True)
+        except (socket.error, httplib.HTTPException) as err:
+            conn.close()
+            if conn.reused or not isinstance(err, socket.error):
+                raise
+            raise urllib2.URLError(err)
+
+    def pooled_open(self, http_class, req):
+        host = req.get_host()
+        if not host:
+            raise urllib2.URLError('no host given')
+
+        headers = dict(req.unredirected_hdrs)
+        headers.update(dict((k, v) for k, v in req.headers.items()
+                            if k not in headers))
+        headers = dict((name.title(), val) for name, val in headers.items())
+
+        conn = self.pool.get(http_class, host, req.timeout)
+        try:
+            r = self.send(conn, req, headers)
+        except (socket.error, httplib.HTTPException):
+            # An idle connection may have been closed by the server
+            # in the meantime: try once more on a fresh connection.
+            # A fresh connection that fails has really failed.
+            if not conn.reused:
+                raise
+            conn = self.pool.get(http_class, host, req.timeout, fresh=True)
+            r = self.send(conn, req, headers)
+
+        resp = urllib2.addinfourl(PooledResponseFile(r, conn, self.pool),
+                                  r.msg, req.get_full_url())
+        resp.code = r.status
+        resp.msg = r.reason
+        return resp
+
 class UrlDownloader:
     '''Manage downloading of a single URL (threadable).
        Keep track of download success or failure.
+
+       Metadata (ETag, Last-Modified, length) is saved in localpath.meta,
+       so downloading again sends a conditional request and skips the
+       file if it hasn't changed, and an interrupted download
+       resumes from localpath.part with a Range request.
     '''
     # Status codes for self.status:
     SUCCESS = 0
@@ -37,12 +192,23 @@ class UrlDownloader:
     EMPTY = 1
     DOWNLOADING = 2
 
+    # How much to read from the network at a time.
+    CHUNKSIZE = 64 * 1024
+
+    # HTTP errors that might go away if we try again later.
+    TRANSIENT_HTTP_CODES = (408, 429, 500, 502, 503, 504)
+
     def __init__(self, url, localpath, timeout=10000,
-                 user_agent=None, referrer=None, allow_cookies=False):
+                 user_agent=None, referrer=None, allow_cookies=False,
+                 progress=None, conditional=True):
         '''Arguments:
             url: the original url to be downloaded
             localpath: where to save it
             timeout=100, referrer=None, user_agent=None, allow_cookies=False
+            progress: function to call with this UrlDownloader
+                      after each chunk, to check bytes_downloaded
+            conditional: use localpath.meta to skip unchanged files
+                      and resume partial ones
         '''
         self.orig_url = url
         self.localpath = localpath
@@ -50,6 +216,8 @@ class UrlDownloader:
         self.user_agent = user_agent
         self.allow_cookies = allow_cookies
         self.referrer = referrer
+        self.progress = progress
+        self.conditional = conditional
 
         # Things we will set during the download
         self.status = UrlDownloader.EMPTY
@@ -60,6 +228,19 @@ class UrlDownloader:
         # self.socket = None
         self.is_gzip = False
         self.response = None
+        self.not_modified = False
+        self.resume_from = 0
+
+        # For retrying failed downloads:
+        self.tries = 0
+        self.transient = False      # Was the last error worth a retry?
+        self.retry_after = None     # Seconds the server asked us to wait
+
+        # Seconds the last try took, successful or not.
+        self.elapsed = None
+
+        # A ConnectionPool to reuse connections, set by UrlDownloadQueue.
+        self.connpool = None
 
         # things we might want to query later:
         self.final_url = None
@@ -85,12 +266,66 @@ class UrlDownloader:
 
         return s
 
+    def load_meta(self):
+        '''Return saved metadata for this URL from localpath.meta, or {}.
+        '''
+        try:
+            with open(self.localpath + '.meta') as fp:
+                meta = json.load(fp)
+            if meta.get('url') == self.orig_url:
+                return meta
+        except (IOError, ValueError):
+            pass
+        return {}
+
+    def save_meta(self, partial):
+        '''Save the validators from the current response in localpath.meta.
+        '''
+        headers = self.response.info()
+        length = headers.get('Content-Length')
+        if length and length.isdigit():
+            length = int(length) + self.resume_from
+        meta = { 'url': self.orig_url,
+                 'etag': headers.get('ETag'),
+                 'last_modified': headers.get('Last-Modified'),
+                 'length': length,
+                 'partial': partial }
+        with open(self.localpath + '.meta', 'w') as fp:
+            json.dump(meta, fp)
+
+    def add_conditional_headers(self, request):
+        '''Using saved metadata, ask the server to send the file only
+           if it has changed, or only the part we don't have yet.
+        '''
+        meta = self.load_meta()
+        validator = meta.get('etag') or meta.get('last_modified')
+        if not validator:
+            return
+
+        partpath = self.localpath + '.part'
+        if meta.get('partial') and os.path.exists(partpath):
+            self.resume_from = os.path.getsize(partpath)
+            request.add_header('Range', 'bytes=%d-' % self.resume_from)
+            request.add_header('If-Range', validator)
+
+        elif os.path.exists(self.localpath) and not meta.get('partial'):
+            # (If the meta is for a partial download whose .part is gone,
+            # it doesn't describe localpath, so fetch the whole thing.)
+            if meta.get('etag'):
+                request.add_header('If-None-Match', meta['etag'])
+            if meta.get('last_modified'):
+                request.add_header('If-Modified-Since', meta['last_modified'])
+
     def resolve_headers(self):
         '''Resolve the URL, follow any redirects, but don't
            actually download the content.
         '''
         request = urllib2.Request(self.orig_url)
 
+        self.resume_from = 0
+        if self.conditional:
+            self.add_conditional_headers(request)
+
         # If we're after the single-page URL, we may need a referrer
         if self.referrer:
             request.add_header('Referer', self.referrer)
@@ -100,17 +335,39 @@ class UrlDownloader:
 
         # A few sites, like http://nymag.com, gzip their http.
         # Python doesn't handle that automatically: we have to ask for it.
-        request.add_header('Accept-encoding', 'gzip')
+        # But ranges of gzipped content can't be resumed.
+        if not self.resume_from:
+            request.add_header('Accept-encoding', 'gzip')
 
+        handlers = []
         if self.allow_cookies:
             # Allow for cookies in the request: some sites, notably nytimes.com,
             # degrade to an infinite redirect loop if cookies aren't enabled.
             cj = CookieJar()
-            opener = urllib2.build_opener(urllib2.HTTPCookieProcessor(cj))
-        else:
-            opener = urllib2.build_opener()
+            handlers.append(urllib2.HTTPCookieProcessor(cj))
+        if self.connpool:
+            handlers.append(KeepAliveHandler(self.connpool))
+        opener = urllib2.build_opener(*handlers)
 
-        self.response = opener.open(request, timeout=self.timeout)
+        try:
+            self.response = opener.open(request, timeout=self.timeout)
+        except urllib2.HTTPError as e:
+            if e.code == 304:
+                # Not modified since last time: nothing to download.
+                e.close()
+                self.not_modified = True
+                return
+            if e.code == 416 and self.resume_from:
+                # Our partial file doesn't fit the server's any more.
+                e.close()
+                os.unlink(self.localpath + '.part')
+                self.resume_from = 0
+                return self.resolve_headers()
+            raise
+
+        if self.response.getcode() != 206:
+            # The server sent the whole thing, not just the rest.
+            self.resume_from = 0
 
         # At this point it would be lovely to check whether the
         # mime type is HTML. Unfortunately, all we have is a
@@ -159,41 +416,86 @@ class UrlDownloader:
     def download_body(self):
         '''Read the content of the link, whose headers are already resolved,
            and save the content to the local file path.
+           The content is streamed to disk a chunk at a time (gunzipping
+           on the way if need be), so memory use stays the same however
+           big the file is. It goes to localpath.part, which is renamed
+           to localpath when it's complete, so localpath is never partial.
+           If the download is interrupted, localpath.part is kept
+           so the next try can resume it.
         '''
-        # This can die in various ways -- caught in download()
-        html = self.response.read()
-
-        # html can be undefined here. If so, no point in doing anything else.
-        if not html:
-            if DEBUG:
-                print >>DEBUG, "Didn't read anything from self.response.read()"
-            raise NoContentError
+        if self.not_modified:
+            self.bytes_downloaded = 0
+            return
 
         if self.is_gzip:
-            buf = StringIO.StringIO(html)
-            f = gzip.GzipFile(fileobj=buf)
-            html = f.read()
-
-        #if DEBUG:
-        #    print >>DEBUG, "self.response.read() returned type", type(html)
-        # Want to end up with unicode. In case it's str, decode it:
-        if type(html) is str:
-            # But sometimes this raises errors anyway, even using
-            # the page's own encoding, so use 'replace':
-            html = html.decode(self.encoding, 'replace')
-
-        # No docs say I should close this. I can only assume.
-        self.response.close()
-
-        self.bytes_downloaded = len(html)
-
-        # Save the bytes we just downloaded to the local file path.
-        fp = open(self.localpath, 'w')
-        if isinstance(html, unicode):
-            fp.write(html.encode(self.encoding))
+            # 16 + MAX_WBITS: expect a gzip header and trailer.
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        else:
+            decompressor = None
+
+        # Only identity-encoded content with a validator can be resumed.
+        resumable = self.conditional and not decompressor and \
+            (self.response.info().get('ETag') or
+             self.response.info().get('Last-Modified'))
+        # A resumable download needs its validators saved now,
+        # for If-Range if it's interrupted. Otherwise leave localpath.meta
+        # describing the old localpath until the new one replaces it,
+        # or an interrupted download would leave the old file looking
+        # up to date.
+        if resumable:
+            self.save_meta(partial=True)
+
+        length = self.response.info().get('Content-Length')
+        if length and length.isdigit():
+            length = int(length)
         else:
-            fp.write(html)
-        fp.close()
+            length = None
+        received = 0
+
+        self.bytes_downloaded = 0
+        tmppath = self.localpath + '.part'
+        try:
+            with open(tmppath, 'ab' if self.resume_from else 'wb') as fp:
+                # This can die in various ways -- caught in download()
+                while True:
+                    chunk = self.response.read(UrlDownloader.CHUNKSIZE)
+                    if not chunk:
+                        break
+                    received += len(chunk)
+                    if decompressor:
+                        chunk = decompressor.decompress(chunk)
+                    fp.write(chunk)
+                    self.bytes_downloaded += len(chunk)
+                    if self.progress:
+                        self.progress(self)
+
+                if decompressor:
+                    chunk = decompressor.flush()
+                    fp.write(chunk)
+                    self.bytes_downloaded += len(chunk)
+
+            # No docs say I should close this. I can only assume.
+            self.response.close()
+
+            # Reading in chunks, httplib doesn't notice if the connection
+            # is closed early, so check we got everything.
+            if length is not None and received < length:
+                raise httplib.IncompleteRead('', length - received)
+
+            # If we got nothing, there's no point in saving anything.
+            if not self.bytes_downloaded and not self.resume_from:
+                if DEBUG:
+                    print >>DEBUG, "Didn't read anything from self.response"
+                raise NoContentError("No content from " + self.orig_url)
+
+            os.rename(tmppath, self.localpath)
+            if self.conditional:
+                self.save_meta(partial=False)
+
+        except:
+            if not resumable and os.path.exists(tmppath):
+                os.unlink(tmppath)
+            raise
 
     def download(self):
         '''Resolve the URL, following any redirects,
@@ -215,6 +517,12 @@ class UrlDownloader:
             return self
 
         self.status = UrlDownloader.DOWNLOADING
+        self.tries += 1
+        self.transient = False
+        self.retry_after = None
+        # Left over from an earlier try that failed.
+        self.errmsg = None
+        start_time = time.time()
         try:
             self.resolve_headers()
             self.download_body()
@@ -245,12 +553,18 @@ class UrlDownloader:
             #     print >>DEBUG, "Some sort of HTTP error"
             self.status = UrlDownloader.ERROR
             self.errmsg = str(e)
+            self.transient = UrlDownloader.is_transient(e)
+            if isinstance(e, urllib2.HTTPError):
+                retry_after = e.headers.get('Retry-After') if e.headers else None
+                if retry_after and retry_after.isdigit():
+                    self.retry_after = int(retry_after)
 
         except httplib.IncompleteRead as e:
             # if DEBUG:
             #     print >>DEBUG, "IncompleteRead on", url
             self.status = UrlDownloader.ERROR
-            self.errmsg = str(e) + "\nIncompleteRead on" + url
+            self.errmsg = str(e) + "\nIncompleteRead on " + self.orig_url
+            self.transient = True
 
         except Exception as e:
             # if DEBUG:
@@ -262,13 +576,41 @@ class UrlDownloader:
             self.errmsg += str(sys.exc_info()[0]) + '\n'
             self.errmsg += str(sys.exc_info()[1]) + '\n'
             self.errmsg += str(traceback.format_exc(sys.exc_info()[2]))
+            self.transient = UrlDownloader.is_transient(e)
 
+        self.elapsed = time.time() - start_time
         return self
 
+    @staticmethod
+    def is_transient(e):
+        '''Is an exception from download() the sort of error
+           that might not happen if we try again later,
+           like a timeout or a 503, as opposed to a 404 or a bad URL?
+        '''
+        if isinstance(e, urllib2.HTTPError):
+            return e.code in UrlDownloader.TRANSIENT_HTTP_CODES
+        if isinstance(e, urllib2.URLError):
+            # reason is a socket error, or a string like "unknown url type"
+            return isinstance(e.reason, socket.error)
+        return isinstance(e, (socket.error, httplib.IncompleteRead,
+                              httplib.BadStatusLine))
+
 class UrlDownloadQueue:
     '''Maintains a queue of UrlDownloaders and keeps them downloading
     (eventually asynchronously).
 
+    No more than maxthreads downloads run at once, and no more than
+    maxperhost from any one server; hosts take turns, so a long list
+    of URLs from one server doesn't starve the others.
+    Connections are kept alive and reused between downloads from
+    the same server.
+
+    Downloads that fail with transient errors (timeouts, 503 and so on)
+    are retried up to maxretries times, after a random delay that
+    doubles each time, starting around backoff seconds.
+    Use as_completed() or wait() to find out when downloads finish,
+    and status() to see what's where.
+
     Call download_queue.add(url, localfile=localfile)
       or download_queue.add(UrlDownloader)
     to add another url to be downloaded.
@@ -279,13 +621,31 @@ class UrlDownloadQueue:
       user_agent
       allow_cookies  default False
     '''
-    def __init__(self, maxthreads=4):
+    # Never wait longer than this between retries.
+    MAX_BACKOFF = 300
+
+    def __init__(self, maxthreads=4, maxperhost=2, maxretries=3, backoff=1.):
         self.queue = []     # implemented as a list
         self.succeeded = []
         self.in_progress = []
+        self.retrying = []  # failed, waiting to be tried again
         self.failed = []
         self.pool = None
         self.maxthreads = maxthreads
+        self.maxperhost = maxperhost
+        self.maxretries = maxretries
+        self.backoff = backoff
+
+        self.connpool = ConnectionPool(maxidle=maxperhost)
+        self.lock = threading.RLock()
+        self.hostqueues = collections.OrderedDict()   # host -> [ downloaders ]
+        self.host_active = collections.Counter()
+        self.downloading = False
+
+        # Notified whenever a download finishes, succeeded or failed:
+        self.changed = threading.Condition(self.lock)
+        # and downloads that are done for good (not retrying) go here.
+        self.completed = Queue.Queue()
 
     def __len__(self) :
         return len(self.queue)
@@ -305,50 +665,165 @@ class UrlDownloadQueue:
 
         if not isinstance(url, UrlDownloader):
             url = UrlDownloader(**kwargs)
-        self.queue.insert(0, url)
+        url.connpool = self.connpool
+        self.enqueue(url)
+
+    def enqueue(self, urldl):
+        with self.lock:
+            self.add_to_queues(urldl)
+        if self.downloading:
+            self.schedule()
+
+    def add_to_queues(self, urldl):
+        '''Queue urldl for its host. Call with self.lock held.'''
+        self.queue.insert(0, urldl)
+        self.hostqueues.setdefault(UrlDownloadQueue.host_of(urldl),
+                                   []).append(urldl)
+
+    @staticmethod
+    def host_of(urldl):
+        return urllib2.Request(urldl.orig_url).get_host()
 
     def download(self):
         '''Start or continue downloading.
-        If maxthreads==0, stay in the current thread and process
-        anything available, then return.
-        If maxthreads>0, use a separate thread for every download,
-        but no more than maxthreads at any given time.
+        Use a separate thread for every download,
+        but no more than maxthreads at any given time,
+        and no more than maxperhost for any one server.
         '''
-        # XXX If maxthreads==1, would like to start a subthread
-        # (if we don't already have one)
-        # and process everything in that thread.
-
         if not self.pool:
             # Make the Pool of workers, maxthreads possible processes
             self.pool = ThreadPool(self.maxthreads)
 
-        while len(self.queue):
-            urldl = self.queue[-1]
-            res = self.pool.apply_async(UrlDownloader.download,
-                                        (urldl,),
-                                        callback=self.cb)
-            self.in_progress.append(urldl)
-            #self.queue.pop()
-            self.queue.remove(urldl)
+        self.downloading = True
+        self.schedule()
 
-        # close the pool and wait for the work to finish 
-        self.pool.close()
+    def schedule(self):
+        '''Start as many queued downloads as the limits allow,
+           taking hosts in turn.
+        '''
+        with self.lock:
+            while len(self.in_progress) < self.maxthreads:
+                urldl = self.next_download()
+                if not urldl:
+                    break
+                self.in_progress.append(urldl)
+                self.queue.remove(urldl)
+                self.pool.apply_async(UrlDownloader.download,
+                                      (urldl,),
+                                      callback=self.cb)
+
+    def next_download(self):
+        '''Pick the next downloader to start, or None.
+           The host that gets served moves to the back of the line.
+        '''
+        for host in list(self.hostqueues):
+            if self.host_active[host] >= self.maxperhost:
+                continue
+            urldls = self.hostqueues.pop(host)
+            urldl = urldls.pop(0)
+            if urldls:
+                self.hostqueues[host] = urldls
+            self.host_active[host] += 1
+            return urldl
+        return None
 
     def cb(self, res):
         '''Callback that will be called for each UrlDownloader
            when it's finished downloading (or has errored out).
            res is a UrlDownloader object.
         '''
-        if res.status == UrlDownloader.SUCCESS:
-            # print "::::: Callback success! Downloaded %d bytes" % res.bytes_downloaded
-            self.succeeded.append(res)
-        elif res.status == UrlDownloader.ERROR:
-            # print "::::: Callback ERROR!", res.errmsg
-            self.failed.append(res)
-        else:
-            # print "::::: Callback: status was", res.status
-            self.failed.append(res)
-        self.in_progress.remove(res)
+        with self.lock:
+            self.in_progress.remove(res)
+            self.host_active[UrlDownloadQueue.host_of(res)] -= 1
+
+            if res.status == UrlDownloader.SUCCESS:
+                # print "::::: Callback success! Downloaded %d bytes" % res.bytes_downloaded
+                self.succeeded.append(res)
+                self.completed.put(res)
+            elif res.transient and res.tries <= self.maxretries:
+                # print "::::: Callback, will retry:", res.errmsg
+                self.retrying.append(res)
+                timer = threading.Timer(self.retry_delay(res),
+                                        self.retry, (res,))
+                timer.daemon = True
+                timer.start()
+            else:
+                # print "::::: Callback ERROR!", res.errmsg
+                self.failed.append(res)
+                self.completed.put(res)
+
+            self.changed.notify_all()
+
+        self.schedule()
+
+    def retry_delay(self, urldl):
+        '''How long to wait before trying urldl again: whatever the server
+           asked for, otherwise exponential backoff with some jitter
+           so retries to the same server don't all land at once.
+        '''
+        if urldl.retry_after:
+            return min(urldl.retry_after, UrlDownloadQueue.MAX_BACKOFF)
+        delay = self.backoff * 2 ** (urldl.tries - 1)
+        return min(delay, UrlDownloadQueue.MAX_BACKOFF) \
+            * random.uniform(.5, 1.5)
+
+    def retry(self, urldl):
+        # Requeue before leaving retrying, all under the lock, so
+        # processing() never sees urldl in neither place and lets
+        # wait() or as_completed() return early.
+        with self.lock:
+            urldl.status = UrlDownloader.EMPTY
+            self.add_to_queues(urldl)
+            self.retrying.remove(urldl)
+        if self.downloading:
+            self.schedule()
+
+    def as_completed(self):
+        '''Generator that yields each UrlDownloader as soon as it's
+           finished for good -- succeeded, or failed with no more retries --
+           until there's nothing left to download.
+           Starts downloading if that hasn't started yet.
+        '''
+        if not self.downloading:
+            self.download()
+        while True:
+            with self.lock:
+                if self.completed.empty() and not self.processing():
+                    return
+            try:
+                # A timeout keeps the wait interruptible with ^C.
+                yield self.completed.get(timeout=1)
+            except Queue.Empty:
+                pass
+
+    def wait(self, timeout=None):
+        '''Wait until everything has been downloaded or has failed,
+           or until timeout seconds have passed.
+           Return True if everything is done.
+        '''
+        if timeout is not None:
+            end = time.time() + timeout
+        with self.changed:
+            while self.processing():
+                if timeout is None:
+                    self.changed.wait(1)
+                else:
+                    remaining = end - time.time()
+                    if remaining <= 0:
+                        return False
+                    self.changed.wait(min(remaining, 1))
+        return True
+
+    def status(self):
+        '''Return a dict of lists of UrlDownloaders,
+           by state: new, in_progress, retrying, succeeded and failed.
+        '''
+        with self.lock:
+            return { 'new': self.queue[::-1],
+                     'in_progress': list(self.in_progress),
+                     'retrying': list(self.retrying),
+                     'succeeded': list(self.succeeded),
+                     'failed': list(self.failed) }
 
     def print_status(self):
         '''Print a summary of what we did and didn't download successfully.
@@ -359,7 +834,12 @@ class UrlDownloadQueue:
 
         print "\n===== Failed:"
         for u in self.failed:
-            print "%s:\n    %s" % (str(u), u.errmsg)
+            print "%s (%d tries):\n    %s" % (str(u), u.tries, u.errmsg)
+
+        if len(self.retrying):
+            print "\n===== Waiting to retry:"
+            for u in self.retrying:
+                print "%s:\n    %s" % (str(u), u.errmsg)
 
         if len(self.in_progress):
             print "\n===== Still in progress:"
@@ -369,7 +849,8 @@ class UrlDownloadQueue:
     def processing(self):
         '''Do we still have URLs in our queues that haven't been processed?
         '''
-        return (len(self.queue) + len(self.in_progress) > 0)
+        return (len(self.queue) + len(self.in_progress)
+                + len(self.retrying) > 0)
 
 if __name__ == "__main__":
     '''One way to test this:
@@ -379,7 +860,6 @@ if __name__ == "__main__":
     import os
     import urlparse
     import posixpath
-    import time
 
     DOWNLOAD_DIR = "/tmp/urls"
 
@@ -413,10 +893,12 @@ if __name__ == "__main__":
     dlqueue.download()
 
     # Now things are downloading asynchronously.
-    # Loop until they're all done.
-    while dlqueue.processing():
-        print "processing ..."
-        time.sleep(1)
+    # Report on each one as it finishes.
+    for urldl in dlqueue.as_completed():
+        if urldl.status == UrlDownloader.SUCCESS:
+            print "Downloaded", urldl
+        else:
+            print "Failed", urldl
 
     dlqueue.print_status()
 
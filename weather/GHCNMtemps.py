@@ -28,9 +28,110 @@ from meantemps import *
 import sys, os
 import urllib
 import tarfile
+import shutil
+import numpy
 
 verbose = True
 
+class GHCNMCache :
+    '''A columnar cache of one GHCNM .dat file: a directory of numpy
+       arrays, one row per station, year and element, sorted by station.
+         ids.npy        11-character station ids
+         years.npy      int16
+         elements.npy   4-character element names, e.g. TMAX
+         values.npy     int16, rows x 12 months, hundredths of a degree C.
+                        -9999 means missing.
+         dmflags.npy, qcflags.npy, dsflags.npy
+                        the 1-character flags for each value, rows x 12
+       plus an index of which rows belong to each station:
+         stations.npy, starts.npy, ends.npy
+       The arrays are memory-mapped, so looking up a few stations
+       only reads those stations' rows from disk.
+    '''
+    COLUMNS = ('ids', 'years', 'elements', 'values',
+               'dmflags', 'qcflags', 'dsflags',
+               'stations', 'starts', 'ends')
+
+    def __init__(self, cachedir) :
+        for col in GHCNMCache.COLUMNS :
+            setattr(self, col,
+                    numpy.load(os.path.join(cachedir, col + '.npy'),
+                               mmap_mode='r'))
+
+    def station_rows(self, station) :
+        '''Return a slice of the rows for the given station id,
+           or None if the station isn't in the file.
+        '''
+        i = numpy.searchsorted(self.stations, station)
+        if i >= len(self.stations) or self.stations[i] != station :
+            return None
+        return slice(self.starts[i], self.ends[i])
+
+    @staticmethod
+    def up_to_date(cachedir, srcfile) :
+        '''Is there a cache in cachedir at least as new as srcfile?'''
+        index = os.path.join(cachedir, 'ends.npy')
+        return os.path.exists(index) and \
+            os.path.getmtime(index) >= os.path.getmtime(srcfile)
+
+    # One record of a GHCNM .dat file:
+    # ID is columns 0-10, YEAR 11-14, ELEMENT 15-18; then
+    # for each month, VALUE (5 chars), DMFLAG, QCFLAG, DSFLAG.
+    RECORD = numpy.dtype([ ('id', 'S11'), ('year', 'S4'), ('element', 'S4'),
+                           ('months', [ ('value', 'S5'), ('dmflag', 'S1'),
+                                        ('qcflag', 'S1'), ('dsflag', 'S1') ],
+                            (12,)) ])
+
+    @staticmethod
+    def parse_dat(fp) :
+        '''Parse a GHCNM .dat file into a dict of column arrays,
+           all at once, by viewing the lines as fixed-width records.
+        '''
+        # Typical line:
+        # 101603550001997TMAX-9999   -9999    1730  G 1950  G 2310  G ...
+        width = GHCNMCache.RECORD.itemsize
+        lines = [ line for line in fp.read().splitlines()
+                  if len(line) >= width ]
+        recs = numpy.array(lines, dtype='S%d' % width).view(GHCNMCache.RECORD)
+        months = recs['months']
+
+        return { 'ids': recs['id'],
+                 'years': recs['year'].astype(numpy.int16),
+                 'elements': recs['element'],
+                 'values': months['value'].astype(numpy.int16),
+                 'dmflags': months['dmflag'],
+                 'qcflags': months['qcflag'],
+                 'dsflags': months['dsflag'] }
+
+    @staticmethod
+    def build(cachedir, fp) :
+        '''Convert an open GHCNM .dat file into a cache in cachedir.'''
+        if verbose :
+            print "Building cache", cachedir
+        cols = GHCNMCache.parse_dat(fp)
+
+        # The files come sorted by station, but don't count on it:
+        # the index needs each station's rows to be contiguous.
+        order = numpy.argsort(cols['ids'], kind='mergesort')
+        for col in cols :
+            cols[col] = cols[col][order]
+        cols['stations'], cols['starts'], counts = \
+            numpy.unique(cols['ids'], return_index=True, return_counts=True)
+        cols['ends'] = cols['starts'] + counts
+
+        # Write to a temporary directory then rename, so an interrupted
+        # build doesn't leave a half-written cache.
+        tmpdir = cachedir + '.tmp'
+        if os.path.exists(tmpdir) :
+            shutil.rmtree(tmpdir)
+        os.mkdir(tmpdir)
+        # ends.npy is written last: up_to_date() checks for it.
+        for col in GHCNMCache.COLUMNS :
+            numpy.save(os.path.join(tmpdir, col + '.npy'), cols[col])
+        if os.path.exists(cachedir) :
+            shutil.rmtree(cachedir)
+        os.rename(tmpdir, cachedir)
+
 class GHCNMWeatherMean(WeatherMean) :
     '''Weather means for one station, over an extended period,
        encompassing means for several different fields keyed by
@@ -93,27 +194,23 @@ class GHCNMWeatherMean(WeatherMean) :
         # 101603550001997TMAX-9999   -9999    1730  G 1950  G 2310  G 2670  G 2670  G-9999   -9999   -9999    2100  G 1850  G
         # We've already established that the first 11 digits match
         # our station by the time add_obs is called.
+        # Data vals start every 8 chars and occupy 5 chars
+        self.add_values(int(line[11:15]),
+                        [ int(line[start:start+5])
+                          for start in range(19, 115, 8) ],
+                        field)
 
-        year = int(line[11:15])
+    def add_values(self, year, values, field) :
+        '''Add observations for a year and station, from a list of
+           12 monthly values in hundredths of a degree, -9999 if missing.
+        '''
         if year < self.minyears[field] : self.minyears[field] = year
         if year > self.maxyears[field] : self.maxyears[field] = year
 
-        # Print another line with the raw strings,
-        # to see if we're converting them properly
         if verbose :
             print year,
-            for month, start in enumerate(range(20, 109, 8)) :
-                num = line[start:start+4]
-                print '%5s' % num,
-            print
-            print '%11s' % '',
-
-        # Data vals start every 8 chars and occupy 5 chars
-        if verbose :
-            print year,
-        for month, start in enumerate(range(20, 109, 8)) :
-            num = line[start:start+4]
-            if num == '9999' :
+        for month, num in enumerate(values) :
+            if num == -9999 :
                 if verbose :
                     print '     ',
                 continue
@@ -126,12 +223,68 @@ class GHCNMWeatherMean(WeatherMean) :
         if verbose :
             print
 
+    def add_years(self, years, values, field) :
+        '''Add observations for many years of one station at once.
+           years is an array of years, values an array of
+           len(years) x 12 monthly values in hundredths of a degree,
+           -9999 if missing.
+        '''
+        if not len(years) :
+            return
+        self.minyears[field] = min(self.minyears[field], int(years.min()))
+        self.maxyears[field] = max(self.maxyears[field], int(years.max()))
+
+        values = numpy.asarray(values)
+        valid = values != -9999
+        months = numpy.tile(numpy.arange(12), len(years))
+        self.add_monthly(field, months, values.ravel() / 100.0,
+                         valid.ravel())
+
+        if verbose :
+            for year, row, ok in zip(years, values, valid) :
+                print year,
+                for num, good in zip(row, ok) :
+                    if good :
+                        print "%5.2f" % (num / 100.0),
+                    else :
+                        print '     ',
+                print
+
+    @staticmethod
+    def get_cache(tarfilename) :
+        '''Return a GHCNMCache for the .dat file inside tarfilename,
+           building it first if it's missing or older than the tarball.
+        '''
+        cachedir = tarfilename
+        if cachedir.endswith('.tar.gz') :
+            cachedir = cachedir[:-7]
+        cachedir += '.cache'
+        if GHCNMCache.up_to_date(cachedir, tarfilename) :
+            return GHCNMCache(cachedir)
+
+        tar = tarfile.open(tarfilename)
+        # The tar file should have two members, with names like
+        # ./ghcnm.v3.2.1.20130413/ghcnm.tmax.v3.2.1.20130413.qca.dat
+        # ./ghcnm.v3.2.1.20130413/ghcnm.tmax.v3.2.1.20130413.qca.inv
+        # The .dat is the data, the .inv is the stations,
+        # though their documentation doesn't say that anywhere.
+        for fnam in tar.getnames() :
+            if os.path.splitext(fnam)[1] == '.dat' :
+                fp = tar.extractfile(fnam)
+                GHCNMCache.build(cachedir, fp)
+                fp.close()
+                break
+        tar.close()
+        return GHCNMCache(cachedir)
+
     @staticmethod
     def compile_temps(stations, means, field) :
         '''Parse a GHCNM file, either of mean max temperatures or mean mins.
            A file contains entries for many different stations;
            each line is a different station and year.
-           Return a dictionary with year: [12 temps]
+           Add the data for each station to means[station].
+           The first time, this converts the file to a GHCNMCache;
+           after that, only the requested stations' rows are read.
         '''
 
         # Use the appropriate filename based on the field:
@@ -144,26 +297,14 @@ class GHCNMWeatherMean(WeatherMean) :
             print "Unknown field", field
             return
 
-        tar = tarfile.open(filename)
-        # The tar file should have two members, with names like
-        # ./ghcnm.v3.2.1.20130413/ghcnm.tmax.v3.2.1.20130413.qca.dat
-        # ./ghcnm.v3.2.1.20130413/ghcnm.tmax.v3.2.1.20130413.qca.inv
-        # The .dat is the data, the .inv is the stations,
-        # though their documentation doesn't say that anywhere.
-        for fnam in tar.getnames() :
-            if os.path.splitext(fnam)[1] == '.dat' :
-                fp = tar.extractfile(fnam)
-
-                for line in fp :
-                    # Is the station one of the ones we're looking for?
-                    if line[0:11] not in stations :
-                        continue
-                    print line[0:11],
-                    means[line[0:11]].add_obs(line, field)
-
-                fp.close()
-                break
-        tar.close()
+        cache = GHCNMWeatherMean.get_cache(filename)
+        for station in stations :
+            rows = cache.station_rows(station)
+            if rows is None :
+                print "No", field, "data for station", station
+                continue
+            means[station].add_years(cache.years[rows], cache.values[rows],
+                                     field)
 
 if __name__ == '__main__' :
 
@@ -5,6 +5,7 @@ import os
 
 import datetime
 from dateutil.relativedelta import relativedelta
+from multiprocessing.dummy import Pool as ThreadPool
 
 import requests
 
@@ -53,6 +54,8 @@ class LANLWeather(object):
 
         self.data = {}
         self.dates = []
+        # Arrays from add_data() not yet joined onto self.data:
+        self.pending = {}
 
         # Set up cache directory. Default: ~/.cache/lanlweather
         # but you can change it with the env var LANLWEATHER
@@ -80,6 +83,11 @@ class LANLWeather(object):
                      'gheat'                 # ground heat flux
     ]
 
+    # How many requests to make to the weather machine at once.
+    # It's a shared server, and already limits how much data
+    # each request can ask for, so don't hammer it.
+    max_requests = 2
+
     # List of towers that offer 15-minute reports.
     # This hasn't been checked. Some tower names may be wrong.
     towers = [ 'mcdn',       # may be ta5
@@ -89,7 +97,8 @@ class LANLWeather(object):
 
     def get_data(self):
         '''Get data from cache if possible. If it's not cached,
-           make net data requests to the weather machine.
+           make net data requests to the weather machine,
+           up to max_requests at a time.
            Make a separate request for each month,
            since the weather machine refuses requests for more than 3 months.
            Use the tower and start/end dates already set in self.
@@ -97,41 +106,80 @@ class LANLWeather(object):
            We'll request full months even if less is requested,
            and we'll request all keys even if we don't need them all,
            so we can keep a more complete cache.
+           Each month is cached twice: as the raw tab-separated text
+           (.csv) and, once parsed, as compressed numpy arrays (.npz),
+           so later runs don't have to parse anything.
         '''
-
-        # Loop over months requested.
         # Start on the first of the month specified by startdate:
         startday = self.start.replace(day=1)
 
-        # Loop over requested months
-        while True:
-            cachefile = os.path.join(self.cachedir,
-                                     "%04d-%02d-%s.csv" % (startday.year,
-                                                           startday.month,
-                                                           self.tower))
-            # See if this month and year is already cached.
-            if os.path.exists(cachefile):
-                with open(cachefile) as fp:
-                    datablob = fp.read()
-                    print "Read from cache file", cachefile
-            else:
-                print "Making request for", startday.year, startday.month
-
-                datablob = self.make_lanl_request(self.tower,
-                                                  startday.year, startday.month)
-
-                if not os.path.exists(self.cachedir):
-                    os.makedirs(self.cachedir)
-
-                with open(cachefile, "w") as outfile:
-                    outfile.write(datablob)
-                    print("Saved to cache %s" % cachefile)
-
-            self.parse_lanl_data(datablob)
-
+        # List the requested months
+        months = []
+        while to_date(startday) <= to_date(self.end):
+            months.append(startday)
             startday += relativedelta(months=1)
-            if to_date(startday) > to_date(self.end):
-                break
+
+        # Fetch any that aren't cached yet.
+        missing = [ m for m in months
+                    if not os.path.exists(self.cachefile(m, "csv")) and
+                       not os.path.exists(self.cachefile(m, "npz")) ]
+        if missing:
+            if not os.path.exists(self.cachedir):
+                os.makedirs(self.cachedir)
+            pool = ThreadPool(min(len(missing), self.max_requests))
+            pool.map(self.fetch_month, missing)
+            pool.close()
+            pool.join()
+
+        for m in months:
+            times, columns = self.load_month(m)
+            self.add_data(times, columns)
+        self.join_data()
+
+    def cachefile(self, startday, ext):
+        return os.path.join(self.cachedir,
+                            "%04d-%02d-%s.%s" % (startday.year,
+                                                 startday.month,
+                                                 self.tower, ext))
+
+    def fetch_month(self, startday):
+        '''Fetch one month from the weather machine into the .csv cache.'''
+        print "Making request for", startday.year, startday.month
+
+        datablob = self.make_lanl_request(self.tower,
+                                          startday.year, startday.month)
+
+        cachefile = self.cachefile(startday, "csv")
+        with open(cachefile, "w") as outfile:
+            outfile.write(datablob)
+            print("Saved to cache %s" % cachefile)
+
+    def load_month(self, startday):
+        '''Load one month from the .npz cache, making it from the
+           .csv cache first if it isn't there or is out of date.
+           Return times, columns as from parse_lanl_blob().
+        '''
+        csvfile = self.cachefile(startday, "csv")
+        npzfile = self.cachefile(startday, "npz")
+        if os.path.exists(npzfile) and \
+           (not os.path.exists(csvfile) or
+            os.path.getmtime(npzfile) >= os.path.getmtime(csvfile)):
+            print "Read from cache file", npzfile
+            with np.load(npzfile) as npz:
+                columns = dict((k, npz[k]) for k in npz.files)
+            return columns.pop('times'), columns
+
+        with open(csvfile) as fp:
+            datablob = fp.read()
+            print "Read from cache file", csvfile
+        times, columns = self.parse_lanl_blob(datablob)
+
+        # Write to a temp file then rename, in case we're interrupted.
+        # savez adds .npz if the name doesn't already end with it.
+        tmpfile = npzfile + ".tmp.npz"
+        np.savez_compressed(tmpfile, times=times, **columns)
+        os.rename(tmpfile, npzfile)
+        return times, columns
 
     def make_lanl_request(self, tower, year, month):
         '''Make a data request for 15-minute data to the LANL weather machine.
@@ -194,64 +242,100 @@ class LANLWeather(object):
 
         return r.text
 
-    def parse_lanl_data(self, blob):
+    @staticmethod
+    def parse_lanl_blob(blob):
+        '''Parse the tab-separated text from the weather machine.
+           Return times, columns: times is a numpy datetime64 array,
+           columns a dict of float arrays for every field in the data,
+           with NaN where data is missing.
+        '''
         lines = blob.split('\n')
 
-        # Find the indices in the data for each key we're interested in.
+        # An error page, or nothing at all: treat it as an empty month.
+        if len(lines) < 7:
+            return np.array([], dtype='datetime64[m]'), \
+                dict((f, np.array([])) for f in LANLWeather.request_keys)
+
         fields = lines[5].split('\t')
         units = lines[6].split('\t')
 
-        # indices will be a list paralleling self.keys,
-        # saving the index of each key in the data table we're reading.
-        indices = []
+        rows = [ line.strip().split('\t') for line in lines[7:]
+                 if line.strip() ]
+        rows = [ row for row in rows if len(row) == len(fields) ]
+        if not rows:
+            return np.array([], dtype='datetime64[m]'), \
+                dict((f, np.array([])) for f in fields if f)
+        table = np.array(rows)
 
-        for i, k in enumerate(self.keys):
-            idx = fields.index(k)
-            if idx <= 0:
-                raise IndexError, k + " is not in dataset"
-            indices.append(idx)
+        # Missing data is denoted with a *.
+        table[(table == '*') | (table == '')] = 'nan'
+
+        columns = {}
+        for i, f in enumerate(fields):
+            if f:
+                columns[f] = table[:, i].astype(float)
+
+        # Build the times from the year, month, day, hour, minute columns.
+        def col(name):
+            return columns.pop(name).astype(int)
+        times = ((col('year') - 1970) * 12 + col('month') - 1) \
+            .astype('datetime64[M]').astype('datetime64[m]')
+        times += ((col('day') - 1) * 24 * 60 + col('hour') * 60
+                  + col('minute')).astype('timedelta64[m]')
 
+        return times, columns
+
+    def parse_lanl_data(self, blob):
+        times, columns = self.parse_lanl_blob(blob)
+        self.add_data(times, columns)
+        self.join_data()
+
+    def add_data(self, times, columns):
+        '''Append parsed data, from parse_lanl_blob(), to
+           self.dates and self.data for each key in self.keys.
+           The values aren't in self.data until join_data() is called:
+           joining each month on as it comes would copy everything
+           loaded so far every time.
+        '''
+        for k in self.keys:
+            if k not in columns:
+                raise IndexError, k + " is not in dataset"
             # initialize a vector of values for that key, if not already there:
             if k not in self.data:
-                self.data[k] = []
-
-        # We'll also need to know the indices for the time values.
-        year = fields.index('year')
-        month = fields.index('month')
-        day = fields.index('day')
-        hour = fields.index('hour')
-        minute = fields.index('minute')
-
-        for line in lines[7:]:
-            line = line.strip()
-            if not line:
-                continue
-            l = line.split('\t')
-            d = datetime.datetime(int(l[year]), int(l[month]), int(l[day]),
-                                  int(l[hour]), int(l[minute]), 0)
-            if self.dates and d <= self.dates[-1]:
-                print "WARNING! Dates out of order,", d, "<=", self.dates[-1]
-            self.dates.append(d)
-            for i, k in enumerate(self.keys):
-                idx = indices[i]
-
-                # Missing data is denoted with a *.
-                # Matplotlib can't deal with None.
-                if not l[idx] or l[idx] == '*':
-                    self.data[k].append(0.)
-
-                # convert temps C -> F
-                elif k.startswith('temp'):
-                    self.data[k].append(c_to_f(float(l[idx])))
-
-                else:
-                    self.data[k].append(float(l[idx]))
+                self.data[k] = np.array([])
+
+        if not len(times):
+            return
+
+        dates = times.astype(datetime.datetime).tolist()
+        if self.dates and dates[0] <= self.dates[-1]:
+            print "WARNING! Dates out of order,", dates[0], "<=", \
+                self.dates[-1]
+        if (np.diff(times) <= np.timedelta64(0)).any():
+            print "WARNING! Dates out of order within", dates[0].year, \
+                dates[0].month
+        self.dates.extend(dates)
+
+        for k in self.keys:
+            vals = columns[k]
+            # convert temps C -> F
+            if k.startswith('temp'):
+                vals = c_to_f(vals)
+            # Matplotlib can't deal with None: use 0 for missing data.
+            self.pending.setdefault(k, []).append(np.where(np.isnan(vals),
+                                                           0., vals))
 
         # We'll scale to self.end, so in case we rounded down,
         # reset self.end so we don't have extra whitespace on the plot.
         if to_date(self.dates[-1]) > to_date(self.realend):
             self.realend = self.dates[-1]
 
+    def join_data(self):
+        '''Join everything added since the last call onto self.data.'''
+        for k, arrays in self.pending.items():
+            self.data[k] = np.concatenate([ self.data[k] ] + arrays)
+        self.pending = {}
+
 class LANLWeatherPlots(LANLWeather):
     '''Plot (as well as fetch and parse) data from the LANL weather machine.
     '''
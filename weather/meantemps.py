@@ -18,6 +18,7 @@
 #
 
 import sys, os
+import numpy
 import matplotlib.pyplot as plt
 
 class WeatherMean :
@@ -37,6 +38,21 @@ class WeatherMean :
     def fields(self) :
         return self.tots.keys()
 
+    def add_monthly(self, field, months, values, valid=None) :
+        '''Add a batch of observations for one field, all at once.
+           months is an array of month numbers, 0-11, and values
+           the matching array of values. valid, if given, is a
+           boolean array saying which values aren't missing.
+        '''
+        if valid is not None :
+            months = months[valid]
+            values = values[valid]
+        tots = numpy.bincount(months, weights=values, minlength=12)
+        counts = numpy.bincount(months, minlength=12)
+        for month in range(12) :
+            self.tots[field][month] += tots[month]
+            self.num_obs[field][month] += int(counts[month])
+
     def normalize(self) :
         for field in self.tots.keys() :
             for month in range(12) :
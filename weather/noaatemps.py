@@ -34,8 +34,17 @@
 
 from meantemps import *
 import urllib
+import urllib2
+import httplib
+import socket
 import sys, os
 import gzip
+import time
+import json
+import math
+import pickle
+import numpy
+from multiprocessing.dummy import Pool as ThreadPool
 
 verbose = True
 
@@ -66,6 +75,43 @@ NOAA_fields = {
                              # Tornado or Funnel Cloud ('T' - 6th digit).
 }
 
+def read_gsod(filename, fields) :
+    '''Read a whole GSOD .op or .op.gz file at once, slicing the
+       fixed-width columns with a numpy structured dtype
+       rather than line by line.
+       Return months, values: months is an int array of 0-11 for each
+       day in the file, values a dict of float arrays for each field
+       in fields. NOAA uses 999.9 or 9999.9 to denote missing data,
+       so callers should ignore anything over 999.
+    '''
+    if filename.endswith('.gz') :
+        fp = gzip.open(filename)
+    else :
+        fp = open(filename)
+    lines = fp.read().splitlines()
+    fp.close()
+
+    # Throw out the first line, with the keys, and anything too short
+    # to have all the fields.
+    width = max(NOAA_fields[f][1] for f in fields + ['MODA'])
+    lines = [ line for line in lines
+              if len(line) >= width and not line.startswith('STN---') ]
+
+    cols = ['MODA'] + fields
+    dtype = numpy.dtype({
+        'names': cols,
+        'formats': [ 'S%d' % (NOAA_fields[f][1] - NOAA_fields[f][0])
+                     for f in cols ],
+        'offsets': [ NOAA_fields[f][0] for f in cols ],
+        'itemsize': width })
+    recs = numpy.array(lines, dtype='S%d' % width).view(dtype)
+
+    months = recs['MODA'].astype(int) // 100 - 1
+    values = {}
+    for field in fields :
+        values[field] = recs[field].astype(float)
+    return months, values
+
 class NOAAWeatherMean(WeatherMean) :
     '''Weather means for one location, over an extended period,
        encompassing means for several different fields keyed by
@@ -101,9 +147,177 @@ class NOAAWeatherMean(WeatherMean) :
                     self.tots[field][month] += val
                     self.num_obs[field][month] += 1
 
+    def add_file(self, filename) :
+        '''Add observations for every field we're tracking
+           from a whole NOAA data file, using read_gsod().
+        '''
+        fields = self.tots.keys()
+        months, values = read_gsod(filename, fields)
+        for field in fields :
+            self.add_monthly(field, months, values[field],
+                             values[field] < 999)
+
+class StationIndex :
+    '''An index of the stations in ish-history.txt, by ICAO id
+       (e.g. KSJC), WMO/USAF number and name, plus a grid of
+       1-degree cells for bounding-box and nearest-station queries.
+       Parsed once and pickled next to ish-history.txt,
+       and reparsed whenever ish-history.txt is newer than the pickle.
+    '''
+    def __init__(self, histfile='ish-history.txt') :
+        self.histfile = histfile
+        self.cachefile = os.path.splitext(histfile)[0] + '.pickle'
+
+        try :
+            if os.path.getmtime(self.cachefile) >= \
+               os.path.getmtime(histfile) :
+                with open(self.cachefile, 'rb') as fp :
+                    self.__dict__.update(pickle.load(fp))
+                    return
+        except (OSError, IOError, pickle.UnpicklingError, EOFError) :
+            pass
+
+        self.parse()
+        try :
+            with open(self.cachefile, 'wb') as fp :
+                pickle.dump({ 'stations': self.stations,
+                              'by_icao': self.by_icao,
+                              'by_wmo': self.by_wmo,
+                              'by_name': self.by_name,
+                              'grid': self.grid },
+                            fp, pickle.HIGHEST_PROTOCOL)
+        except IOError as e :
+            print "Couldn't save station index:", e
+
+    def parse(self) :
+        '''Parse ish-history.txt. Each station is a tuple
+           (usaf, wban, name, icao, lat, lon), lat and lon in degrees
+           or None if unknown. If several lines share an id,
+           the first one wins, as findstations() always did.
+        '''
+        # Typical line:
+        # 724945 23293 NORMAN Y MINETA SAN           US US CA KSJC  +37359 -121924 +00152    19730101 20121212
+        self.stations = []
+        self.by_icao = {}
+        self.by_wmo = {}
+        self.by_name = {}
+        self.grid = {}
+        with open(self.histfile) as ish :
+            for line in ish :
+                if not line[0:6].isdigit() :
+                    continue
+                try :
+                    lat = int(line[58:64]) / 1000.
+                    lon = int(line[65:72]) / 1000.
+                    if lat < -90 or lat > 90 or lon < -180 or lon > 180 :
+                        raise ValueError
+                except ValueError :
+                    lat = lon = None
+                station = (line[0:6], line[7:12], line[13:43].strip(),
+                           line[52:56].strip(), lat, lon)
+
+                n = len(self.stations)
+                self.stations.append(station)
+                if station[3] :
+                    self.by_icao.setdefault(station[3], n)
+                self.by_wmo.setdefault(station[0], n)
+                self.by_name.setdefault(station[2].upper(), n)
+                if lat is not None :
+                    self.grid.setdefault((int(math.floor(lat)),
+                                          int(math.floor(lon))),
+                                         []).append(n)
+
+    def lookup(self, key) :
+        '''Find a station by ICAO id, WMO/USAF number or exact name.
+           Return the station tuple, or None.
+        '''
+        for index in (self.by_icao, self.by_wmo) :
+            if key in index :
+                return self.stations[index[key]]
+        n = self.by_name.get(key.upper())
+        if n is not None :
+            return self.stations[n]
+        return None
+
+    def in_box(self, minlat, maxlat, minlon, maxlon) :
+        '''Return the stations inside a lat/lon bounding box.'''
+        found = []
+        for cellat in range(int(math.floor(minlat)),
+                            int(math.floor(maxlat)) + 1) :
+            for cellon in range(int(math.floor(minlon)),
+                                int(math.floor(maxlon)) + 1) :
+                for n in self.grid.get((cellat, cellon), []) :
+                    st = self.stations[n]
+                    if minlat <= st[4] <= maxlat and \
+                       minlon <= st[5] <= maxlon :
+                        found.append(st)
+        return found
+
+    @staticmethod
+    def distance(lat1, lon1, lat2, lon2) :
+        '''Great-circle distance in km.'''
+        lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+        a = math.sin((lat2 - lat1) / 2) ** 2 + \
+            math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+        return 6371 * 2 * math.asin(min(1, math.sqrt(a)))
+
+    def nearest(self, lat, lon, n=1) :
+        '''Return the n stations nearest lat, lon, nearest first,
+           as a list of (km, station).
+           Searches outward from lat, lon a ring of grid cells at a time,
+           stopping once no unsearched cell could hold anything closer.
+        '''
+        cellat = int(math.floor(lat))
+        cellon = int(math.floor(lon))
+        found = []
+        seen = set()
+        ring = 0
+        # A degree of latitude is about 111 km; at most 180 rings
+        # covers the whole globe.
+        while ring <= 180 :
+            if ring == 0 :
+                offsets = [ (0, 0) ]
+            else :
+                offsets = [ (dlat, dlon) for dlat in (-ring, ring)
+                            for dlon in range(-ring, ring + 1) ] + \
+                          [ (dlat, dlon) for dlat in range(1 - ring, ring)
+                            for dlon in (-ring, ring) ]
+            for dlat, dlon in offsets :
+                # Longitude wraps around; far enough out, cells repeat.
+                cell = (cellat + dlat, (cellon + dlon + 180) % 360 - 180)
+                if cell in seen :
+                    continue
+                seen.add(cell)
+                for i in self.grid.get(cell, []) :
+                    st = self.stations[i]
+                    found.append((StationIndex.distance(lat, lon,
+                                                        st[4], st[5]),
+                                  st))
+            found.sort()
+            # Anything in the next ring is at least ring degrees of
+            # latitude or longitude away. Degrees of longitude shrink
+            # toward the poles, hence the cos; once the rings reach
+            # a pole, everything has to be searched.
+            if len(found) >= n and \
+               found[n-1][0] < ring * 111 * math.cos(math.radians(
+                       min(90, abs(lat) + ring + 1))) :
+                break
+            ring += 1
+        return found[:n]
+
+_station_index = None
+
+def station_index() :
+    '''The StationIndex for ish-history.txt, loaded once.'''
+    global _station_index
+    if not _station_index :
+        _station_index = StationIndex()
+    return _station_index
+
 def findstations(stationnames) :
-    '''Search through ish-history.txt for given station names.
+    '''Look up the given stations in ish-history.txt, using StationIndex.
        stationnames is a list of strings like 'KSJC'
+       (or WMO numbers like '724945', or full station names)
        and we return a dictionary of lists of the first two numbers from the
        first match in the file for each station, plus the long station name.
        E.g. pass in ['KSJC', 'KFLG']
@@ -112,16 +326,14 @@ def findstations(stationnames) :
 723750 03103 FLAGSTAFF AIRPORT             US US AZ KFLG  +35144 -111666 +21391    20050101 20121212
        and return { 'KSJC' : [724945, 23293, 'NORMAN Y MINETA SAN'],
                     'KFLG' : [723750, 03103, 'FLAGSTAFF AIRPORT'] }
+       Stations that aren't found are left out.
     '''
+    index = station_index()
     result = {}
-    ish = open('ish-history.txt')
-    for line in ish :
-        for station in stationnames :
-            if station not in result.keys() :
-                if station == line[52:56] :
-                    result[station] = [ line[0:6], line[7:12],
-                                        line[13:43].strip() ]
-    ish.close()
+    for station in stationnames :
+        st = index.lookup(station)
+        if st :
+            result[station] = [ st[0], st[1], st[2] ]
     return result
 
 def noaa_files(stationnames, years) :
@@ -145,13 +357,189 @@ def noaa_files(stationnames, years) :
             urldict[station].append(url)
     return urldict
 
+class GSODMirror :
+    '''A local mirror of the GSOD station-year files we need,
+       fetched several at a time.
+       NOAA has a lot of missing files -- many stations don't have
+       anything before 1995 -- so misses are remembered in a negative
+       cache, gsod-missing.json, and not asked for again until
+       they're older than missing_ttl seconds.
+       Files for the last revalidate_years years are still being
+       added to, so they're fetched again once they're older than
+       max_age seconds.
+       baseurl can point to any server with the same YEAR/file layout,
+       e.g. a local web server for testing.
+    '''
+    BASEURL = 'ftp://ftp.ncdc.noaa.gov/pub/data/gsod/'
+
+    def __init__(self, download_dir=".", baseurl=None, maxthreads=4,
+                 missing_ttl=30*24*60*60, revalidate_years=2,
+                 max_age=24*60*60) :
+        self.download_dir = download_dir
+        self.baseurl = baseurl or GSODMirror.BASEURL
+        if not self.baseurl.endswith('/') :
+            self.baseurl += '/'
+        self.maxthreads = maxthreads
+        self.missing_ttl = missing_ttl
+        self.revalidate_years = revalidate_years
+        self.max_age = max_age
+
+        self.missing_file = os.path.join(download_dir, 'gsod-missing.json')
+        try :
+            with open(self.missing_file) as fp :
+                self.missing = json.load(fp)
+        except (IOError, ValueError) :
+            self.missing = {}
+
+    @staticmethod
+    def basename(stn, wban, year) :
+        return '%s-%s-%d.op.gz' % (stn, wban, year)
+
+    def url(self, stn, wban, year) :
+        return '%s%d/%s' % (self.baseurl, year,
+                            GSODMirror.basename(stn, wban, year))
+
+    def filename(self, stn, wban, year) :
+        return os.path.join(self.download_dir,
+                            GSODMirror.basename(stn, wban, year))
+
+    def needs_fetch(self, stn, wban, year) :
+        '''Do we need to download this file?'''
+        now = time.time()
+        basename = GSODMirror.basename(stn, wban, year)
+        if basename in self.missing :
+            if now - self.missing[basename] < self.missing_ttl :
+                return False
+        filename = self.filename(stn, wban, year)
+        if not os.path.exists(filename) :
+            return True
+        # Earlier versions left zero-length files for misses.
+        if os.path.getsize(filename) == 0 :
+            return True
+        if year > time.localtime().tm_year - self.revalidate_years :
+            return now - os.path.getmtime(filename) > self.max_age
+        return False
+
+    def fetch_one(self, stn_wban_year) :
+        '''Download one file, to a .part file and then renamed.
+           Return (basename, status) where status is
+           'ok', 'missing' or an error message.
+        '''
+        stn, wban, year = stn_wban_year
+        url = self.url(stn, wban, year)
+        filename = self.filename(stn, wban, year)
+        basename = GSODMirror.basename(stn, wban, year)
+        partfile = filename + '.part'
+        if verbose :
+            print "downloading", url
+        try :
+            response = urllib2.urlopen(url, timeout=60)
+            length = response.info().getheader('Content-Length')
+            nbytes = 0
+            with open(partfile, 'wb') as fp :
+                while True :
+                    data = response.read(65536)
+                    if not data :
+                        break
+                    fp.write(data)
+                    nbytes += len(data)
+            response.close()
+            # read(n) just stops early if the connection drops.
+            if length and nbytes < int(length) :
+                return basename, 'only got %d of %s bytes' % (nbytes, length)
+            os.rename(partfile, filename)
+            return basename, 'ok'
+        except urllib2.HTTPError as e :
+            if e.code in (404, 410) :
+                return basename, 'missing'
+            return basename, str(e)
+        except urllib2.URLError as e :
+            # FTP says "550 No such file or directory".
+            if '550' in str(e.reason) :
+                return basename, 'missing'
+            return basename, str(e)
+        except (httplib.IncompleteRead, socket.error) as e :
+            # The connection dropped partway through.
+            return basename, str(e)
+        except (IOError, OSError) as e :
+            return basename, str(e)
+        finally :
+            # Whatever went wrong, don't leave a truncated .part
+            # where it could be taken for part of the mirror.
+            if os.path.exists(partfile) :
+                os.unlink(partfile)
+
+    def fetch(self, stationcodes, years) :
+        '''Make sure the files for every station in stationcodes
+           (a list of [stn, wban]) and every year are here,
+           downloading whichever are needed maxthreads at a time.
+           Return a dict of (stn, wban, year): local filename,
+           or None if NOAA doesn't have that file.
+        '''
+        wanted = [ (code[0], code[1], y)
+                   for code in stationcodes for y in years ]
+        needed = [ w for w in wanted if self.needs_fetch(*w) ]
+
+        if needed :
+            pool = ThreadPool(self.maxthreads)
+            results = pool.map(self.fetch_one, needed)
+            pool.close()
+            pool.join()
+
+            now = time.time()
+            for basename, status in results :
+                if status == 'ok' :
+                    self.missing.pop(basename, None)
+                elif status == 'missing' :
+                    self.missing[basename] = now
+                    # Clean up any zero-length file from earlier versions.
+                    filename = os.path.join(self.download_dir, basename)
+                    if os.path.exists(filename) and \
+                       os.path.getsize(filename) == 0 :
+                        os.unlink(filename)
+                else :
+                    print "Couldn't download", basename, ":", status
+            with open(self.missing_file + '.part', 'w') as fp :
+                json.dump(self.missing, fp, indent=1)
+            os.rename(self.missing_file + '.part', self.missing_file)
+
+        files = {}
+        for w in wanted :
+            filename = self.filename(*w)
+            if GSODMirror.basename(*w) in self.missing or \
+               not os.path.exists(filename) or \
+               os.path.getsize(filename) == 0 :
+                files[w] = None
+            else :
+                files[w] = filename
+        return files
+
+def Usage() :
+    print "Usage: %s [-b baseurl] [-j threads] [station ...]" \
+        % os.path.basename(sys.argv[0])
+    print "  -b: where to download GSOD files from, default", \
+        GSODMirror.BASEURL
+    print "  -j: how many files to download at once"
+    sys.exit(1)
+
 if __name__ == '__main__' :
-    if len(sys.argv) <= 1 :
+    args = sys.argv[1:]
+    baseurl = None
+    maxthreads = 4
+    while args and args[0].startswith('-') :
+        if args[0] == '-b' and len(args) > 1 :
+            baseurl = args[1]
+        elif args[0] == '-j' and len(args) > 1 :
+            maxthreads = int(args[1])
+        else :
+            Usage()
+        args = args[2:]
+
+    if not args :
         stations = [ 'KSJC', 'KFLG' ]
     else :
-        stations = sys.argv[1:]
+        stations = args
     years = range(1991, 2012)
-    urls = noaa_files(stations, years)
     fields = ['TEMP', 'MAX', 'MIN', 'PRCP', 'SNDP']
     download_dir = "."
 
@@ -159,38 +547,26 @@ if __name__ == '__main__' :
     for station in stations :
         means[station] = NOAAWeatherMean(fields)
 
-    # Get all the stationcodes. Best to do this all at once since it
-    # requires parsing a large file.
+    # Get all the stationcodes.
     stationcodes = findstations(stations)
+    for station in stations :
+        if station not in stationcodes :
+            print "Can't find station", station
+            sys.exit(1)
 
-    for i, station in enumerate(stations) :
-        for y in years :
-            basename = '%s-%s-%d.op.gz' % (stationcodes[station][0],
-                                           stationcodes[station][1], y)
-            url = 'ftp://ftp.ncdc.noaa.gov/pub/data/gsod/%d/%s' % (y, basename)
-            filename = os.path.join(download_dir, basename)
-
-            # Download the file if it's not already here:
-            if not os.path.exists(filename):
-                try:
-                    if verbose: print "downloading", url
-                    urllib.urlretrieve(url, filename)
-                except IOError as e:
-                    print(e)
-                    print "Skipping", filename, "for station", station
-                    # NOAA has a lot of missing files -- many stations
-                    # don't have anything before 1995.
-                    # Since it will probably get this error every time,
-                    # create a zero-length file there:
-                    emptyfile = open(filename, 'w')
-                    emptyfile.close()
-                    continue
+    mirror = GSODMirror(download_dir, baseurl, maxthreads)
+    files = mirror.fetch([ stationcodes[station] for station in stations ],
+                         years)
 
-            # Now the file should be there.
-            fp = gzip.open(filename)
-            for line in fp :
-                means[station].add_obs(line)
-            fp.close()
+    for station in stations :
+        stn, wban = stationcodes[station][0:2]
+        for y in years :
+            filename = files[(stn, wban, y)]
+            if not filename :
+                if verbose :
+                    print "No data for", station, "in", y
+                continue
+            means[station].add_file(filename)
 
     display_results(means)
 